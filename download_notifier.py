@@ -1,27 +1,62 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import filedialog, font as tkfont, messagebox, ttk
 import os
 import time
 import math
+import queue
+import logging
+import logging.handlers
 import threading
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 import pygame # Used for playing alarm sounds
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache, partial
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 import re
 import sqlite3 # Added for potential Telegram DB access, though highly experimental
 import sys
+from collections import ChainMap, deque
+import heapq
+import itertools
 from pathlib import Path
 from datetime import datetime
 import webbrowser
 import hashlib
 
 # --- Configuration ---
+# Home directory resolved once at import; path building reuses this instead
+# of calling os.path.expanduser repeatedly.
+_HOME = Path.home()
+
 # Default download directory (can be changed by user)
 # This is a common path for Windows downloads.
-DEFAULT_DOWNLOAD_DIR = os.path.join(os.path.expanduser("~"), "Downloads")
+DEFAULT_DOWNLOAD_DIR = str(_HOME / "Downloads")
+
+# Quick-path buttons on the Monitor tab, built once at import time
+_QUICK_PATHS_ROW1 = (
+    ("📥 Downloads", DEFAULT_DOWNLOAD_DIR),
+    ("🖥️ Desktop", str(_HOME / "Desktop")),
+    ("📄 Documents", str(_HOME / "Documents")),
+)
+_QUICK_PATHS_ROW2 = (
+    ("🎵 Music", str(_HOME / "Music")),
+    ("🎬 Videos", str(_HOME / "Videos")),
+    ("🖼️ Pictures", str(_HOME / "Pictures")),
+)
+
+# Candidate Telegram data directories, computed once at import
+_TG_CANDIDATES = (
+    str(_HOME / "AppData" / "Roaming" / "Telegram Desktop" / "tdata"), # Windows
+    str(_HOME / ".local" / "share" / "TelegramDesktop" / "tdata"), # Linux
+    str(_HOME / "Library" / "Application Support" / "Telegram Desktop" / "tdata"), # macOS
+)
 # Pygame supports both WAV and MP3.
 # Make sure you have an alarm.wav or alarm.mp3 file in the same directory as this script.
 ALARM_SOUND_FILE = "alarm.wav" # You can change this to "alarm.mp3" if you prefer
@@ -30,11 +65,164 @@ ALARM_SOUND_FILE = "alarm.wav" # You can change this to "alarm.mp3" if you prefe
 MIN_FILE_SIZE_MB = 1  # Only notify for files larger than 1MB
 MAX_PROCESSING_TIME = 300  # Maximum time to wait for a file to complete (5 minutes)
 
+# Persistent expected-size cache (shared across runs)
+SIZE_CACHE_FILE = ".sizecache.db"
+SIZE_CACHE_TTL = 24 * 3600  # Entries older than a day are considered stale
+
 # UI Configuration
 APP_VERSION = "2.0.0"
+WINDOW_WIDTH = 900
+WINDOW_HEIGHT = 700
 WINDOW_MIN_WIDTH = 800
 WINDOW_MIN_HEIGHT = 600
 SETTINGS_FILE = "settings.json"
+HISTORY_SPILL_FILE = "history_overflow.jsonl" # Records evicted from the in-memory history
+
+# CSV export schema: itemgetter pulls all five fields in one C call, and
+# layering each record over the blanks dict supplies the defaults
+_CSV_FIELDS = ("timestamp", "filename", "size", "path", "status")
+_CSV_BLANKS = dict.fromkeys(_CSV_FIELDS, "")
+_CSV_ROW = itemgetter(*_CSV_FIELDS)
+
+# --- Shared HTTP session ---
+# A single pooled session so repeated HEAD lookups reuse TCP/TLS connections
+# instead of paying the full connection setup cost on every call.
+_HTTP_SESSION = requests.Session()
+# One quick retry absorbs transient connection resets without the caller
+# paying a second full HEAD round-trip on every flaky request
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                            max_retries=Retry(total=1, backoff_factor=0.1))
+_HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+_HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+
+@lru_cache(maxsize=512)
+def _head_content_length(url):
+    """
+    Performs an HTTP HEAD request and returns the Content-Length, if any.
+    Results are cached per URL so the re-poll loop doesn't hit the network
+    again for a file it has already asked about.
+    """
+    response = _HTTP_SESSION.head(url, timeout=5, allow_redirects=True)
+    content_length = response.headers.get('Content-Length')
+    if content_length:
+        return int(content_length)
+    return None
+
+# Shared decoder for companion-file parsing; avoids rebuilding one per call.
+_JSON_DECODER = json.JSONDecoder()
+
+def _sha256_file(path):
+    """
+    Computes the SHA-256 of a completed download for the history record.
+    Uses hashlib.file_digest (3.11+), which hashes in C with the GIL
+    released; older interpreters fall back to mmap so OpenSSL still runs
+    over one contiguous buffer instead of a Python read-loop.
+    """
+    with open(path, 'rb') as f:
+        try:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        except AttributeError:
+            import mmap
+            h = hashlib.sha256()
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    h.update(view)
+            except (ValueError, OSError): # Empty file or mmap unavailable
+                h.update(f.read())
+            return h.hexdigest()
+
+# Filesystem types where native FS events (inotify/FSEvents/ReadDirectoryChangesW)
+# are unreliable or unavailable, so we fall back to a polling observer.
+_REMOTE_FS_TYPES = {"nfs", "nfs4", "cifs", "smbfs", "smb3", "fuse.sshfs", "afs"}
+
+def _is_network_path(path):
+    """
+    Best-effort check for whether a path lives on a network mount.
+    On Windows this means a UNC share; on POSIX the longest matching
+    mount point in /proc/mounts is checked against known remote FS types.
+    """
+    if sys.platform.startswith('win'):
+        return path.startswith('\\\\')
+    try:
+        best_match = ""
+        is_remote = False
+        with open('/proc/mounts', 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mount_point, fs_type = parts[1], parts[2]
+                if path.startswith(mount_point) and len(mount_point) > len(best_match):
+                    best_match = mount_point
+                    is_remote = fs_type in _REMOTE_FS_TYPES
+        return is_remote
+    except OSError:
+        return False
+
+def _make_observer(path):
+    """
+    Returns a native watchdog Observer, or a PollingObserver for network
+    mounts where native events silently never arrive.
+    """
+    if _is_network_path(path):
+        return PollingObserver(timeout=2.0)
+    return Observer()
+
+# Thresholds for human-readable sizes, largest first; integer powers of
+# two so the common case is one comparison and one division
+_SIZE_UNITS = (
+    (1 << 30, "GB"),
+    (1 << 20, "MB"),
+    (1 << 10, "KB"),
+)
+
+def _format_size(n_bytes):
+    """Formats a byte count as GB/MB/KB with two decimals, or plain bytes."""
+    for threshold, unit in _SIZE_UNITS:
+        if n_bytes >= threshold:
+            return f"{n_bytes / threshold:.2f} {unit}"
+    return f"{n_bytes:,} bytes"
+
+def _ensure_alarm_file():
+    """
+    Generates the default beep wav if the alarm file is missing. One
+    os.stat replaces the old exists()-then-open pair, and the whole check
+    only runs on the first actual playback rather than at every launch.
+    """
+    try:
+        os.stat(ALARM_SOUND_FILE)
+        return
+    except FileNotFoundError:
+        pass
+
+    try:
+        import wave
+        import struct
+        import math
+
+        sample_rate = 44100
+        frames = int(1.5 * sample_rate)
+        with wave.open(ALARM_SOUND_FILE, 'w') as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 2 bytes per sample
+            wav_file.setframerate(sample_rate)
+            for i in range(frames):
+                sample = 0.5 * math.sin(2 * math.pi * 800 * i / sample_rate)
+                wav_file.writeframes(struct.pack('<h', int(sample * 32767)))
+    except Exception as e:
+        print(f"Could not create alarm sound file: {e}")
+        print("You may need to provide your own alarm.wav file.")
+
+# Maps a button's theme role to the (bg, fg) keys of the theme dict, so
+# theming does one dict lookup per button instead of a chain of identity
+# comparisons against every known button attribute.
+_ROLE_COLORS = {
+    "start": ("button_bg", "button_fg"),
+    "stop": ("stop_button_bg", "stop_button_fg"),
+    "browse": ("browse_button_bg", "browse_button_fg"),
+    "stop_alarm": ("stop_alarm_button_bg", "stop_alarm_button_fg"),
+    "log_action": ("browse_button_bg", "browse_button_fg"),
+}
 
 # --- Enhanced Creative Theme Configuration ---
 CREATIVE_THEMES = {
@@ -105,6 +293,28 @@ LIGHT_THEME = {
     "hover": "#e0e0e0", "gradient_start": "#f5f5f5", "gradient_end": "#ffffff"
 }
 
+class PendingDownload:
+    """
+    Per-file tracking state carried through the processing queue. The
+    filename and directory are parsed once at enqueue time, and creation
+    time / expected size live on one record instead of parallel per-path
+    dicts that each need their own lookup. Explicit __slots__ keeps the
+    per-record memory win of dataclass(slots=True) without its Python
+    3.10 floor (the app documents 3.7+).
+    """
+    __slots__ = ("path", "name", "directory", "created_at",
+                 "expected_size", "final_size", "last_size")
+
+    def __init__(self, path, name, directory, created_at,
+                 expected_size=None, final_size=None, last_size=-1):
+        self.path = path
+        self.name = name
+        self.directory = directory
+        self.created_at = created_at
+        self.expected_size = expected_size # Optional[int]
+        self.final_size = final_size # Optional[int]
+        self.last_size = last_size
+
 # --- Enhanced File System Event Handler with Size Checking ---
 class SizeAwareDownloadHandler(FileSystemEventHandler):
     """
@@ -112,15 +322,72 @@ class SizeAwareDownloadHandler(FileSystemEventHandler):
     Attempts to get expected size from various sources (HTTP HEAD, companion files,
     and a highly experimental/speculative check for Telegram's database).
     """
+    # Precomputed at class scope so the per-event temp check is a couple of
+    # C-level str.endswith/startswith calls rather than a Python loop.
+    _TEMP_EXTENSIONS = (
+        ".tmp", ".crdownload", ".part", ".download", ".filepart",
+        ".idm", ".idm.tmp", ".idm.bak", ".dwnl", ".inprogress",
+        ".downloading", ".temp", ".partial", ".resume",
+        ".unconfirmed", ".opdownload", ".!ut", ".td", # .td for Telegram temp
+        ".crswap", ".swp", ".lock", ".~"
+    )
+    _TEMP_PREFIXES = ("downloading_", "temp_", "~")
+
+    # Size-extraction patterns compiled once for all FS events. The JSON key
+    # names and the loose text patterns used by the companion-file and
+    # Telegram metadata parsers are folded into a single alternation.
+    _SIZE_KEYS = ('size', 'total_size', 'content_length', 'filesize', 'length')
+    # Case-folded markers identifying paths inside Telegram's own folders;
+    # checked as substrings, which beats a regex scan for two literals
+    _TG_PATH_MARKERS = ("telegram desktop", "tdata")
+
+    _SIZE_RE = re.compile(
+        r'(?:"(?:size|total_size|content_length|filesize|length)"\s*:\s*'
+        r'|(?:size|length|bytes|total)[:=\s"]*)(\d+)',
+        re.IGNORECASE
+    )
+    _COMPANION_SUFFIXES = ('.info', '.meta', '.json')
+
+    # The located Telegram DB path is shared across handler instances: a
+    # new handler is built on every monitoring start, and re-walking tdata
+    # each time would repeat the same directory scan for the same answer.
+    _TG_DB_CACHE_TTL = 600 # seconds before the walk is redone
+    _tg_db_cache = None
+    _tg_db_cache_ts = 0.0
+
     def __init__(self, app_instance):
         super().__init__()
         self.app = app_instance
-        self.download_queue = []
-        self.processing_thread = None
+        self.download_queue = deque()
+        # Latest on_modified timestamp per tracked file, fed by watchdog
+        # events so completion detection never has to poll for changes
+        self.file_last_modified = {}
+        # Incomplete files wait here keyed by their next-recheck time, so
+        # the worker wakes exactly when one is due instead of cycling the
+        # whole queue with a fixed sleep. The counter breaks timestamp ties.
+        self._retry_heap = []
+        self._retry_seq = itertools.count()
         self.stop_processing_event = threading.Event()
-        self.file_creation_times = {} # To track when a file was first detected
-        self.file_expected_sizes = {} # Store expected file sizes if found
+        # Single long-lived worker: queue pushes wake it via the condition,
+        # so no thread is spawned (and later re-spawned) per download burst.
+        self._queue_cv = threading.Condition()
+        self.pending = {} # path -> PendingDownload for files being tracked
         self.telegram_db_path = self._find_telegram_db() # Attempt to find Telegram DB
+        self._tg_conn = None # Lazily opened, long-lived read-only connection
+        self._tg_conn_failed = False # Remember failures so we don't re-probe per file
+        self._tg_lock = threading.Lock()
+        self._tg_size_cache = {} # filename -> size (or None) from previous DB lookups
+        self._inflight = set() # Paths already queued, to coalesce bursty FS events
+        # Memoized name-based classifications; the same path is re-classified
+        # on every re-queue pass otherwise. Entries die with the file's data.
+        self._temp_name_cache = {}
+        self._telegram_path_cache = {}
+        self._size_cache_lock = threading.Lock()
+        self._size_cache = self._open_size_cache()
+        self.processing_thread = threading.Thread(target=self._process_downloads,
+                                                  name="download-processor")
+        self.processing_thread.daemon = True # Allow thread to exit with main app
+        self.processing_thread.start()
 
     def _find_telegram_db(self):
         """
@@ -128,23 +395,48 @@ class SizeAwareDownloadHandler(FileSystemEventHandler):
         for potential download info. This is highly experimental and may not work
         reliably across different Telegram versions or OS configurations.
         Telegram's internal database structure is complex and not publicly documented.
+
+        The result is cached at class level so restarting monitoring does
+        not repeat the directory walk; the cache expires after
+        _TG_DB_CACHE_TTL seconds in case Telegram was (un)installed.
         """
-        common_telegram_paths = [
-            os.path.join(os.path.expanduser("~"), "AppData", "Roaming", "Telegram Desktop", "tdata"), # Windows
-            os.path.join(os.path.expanduser("~"), ".local", "share", "TelegramDesktop", "tdata"), # Linux
-            os.path.join(os.path.expanduser("~"), "Library", "Application Support", "Telegram Desktop", "tdata"), # macOS
-        ]
-        
-        for base_path in common_telegram_paths:
-            if os.path.exists(base_path):
-                # Look for database files in subdirectories, often named like 'data0.db', 'data1.db'
-                for root, dirs, files in os.walk(base_path):
-                    for file in files:
-                        # Prioritize files that look like main data stores
-                        if file.endswith('.db') and ('data' in file.lower() or 'downloads' in file.lower()):
-                            return os.path.join(root, file)
-                # If no specific DB file, return the tdata directory itself for broader search later
-                return base_path
+        cls = type(self)
+        if cls._tg_db_cache_ts and time.time() - cls._tg_db_cache_ts < cls._TG_DB_CACHE_TTL:
+            return cls._tg_db_cache
+        cls._tg_db_cache = self._locate_telegram_db()
+        cls._tg_db_cache_ts = time.time()
+        return cls._tg_db_cache
+
+    def _locate_telegram_db(self):
+        """Uncached body of the Telegram DB search."""
+        for base_path in _TG_CANDIDATES:
+            if not os.path.exists(base_path):
+                continue
+            # Breadth-first scandir walk that stops at the first match.
+            # os.scandir returns dirent data in batches and DirEntry caches
+            # the file type, so this avoids a stat call per entry that
+            # os.walk over a large tdata tree would pay.
+            pending = deque([(base_path, 0)])
+            while pending:
+                directory, depth = pending.popleft()
+                try:
+                    entries = os.scandir(directory)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        name_lower = entry.name.lower()
+                        if (entry.is_file(follow_symlinks=False) and
+                                name_lower.endswith('.db') and
+                                ('data' in name_lower or 'downloads' in name_lower)):
+                            # Prioritize files that look like main data stores
+                            return entry.path
+                        # tdata nests media caches arbitrarily deep; the DB
+                        # sits near the top, so bound the descent
+                        if depth < 3 and entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, depth + 1))
+            # If no specific DB file, return the tdata directory itself for broader search later
+            return base_path
         return None
 
     def _get_expected_file_size_from_url(self, url):
@@ -153,10 +445,7 @@ class SizeAwareDownloadHandler(FileSystemEventHandler):
         This is useful if the download URL is known.
         """
         try:
-            response = requests.head(url, timeout=5, allow_redirects=True)
-            content_length = response.headers.get('Content-Length')
-            if content_length:
-                return int(content_length)
+            return _head_content_length(url)
         except requests.exceptions.RequestException as e:
             self.app._log_message(f"HTTP HEAD request failed for URL: {e}", "info")
         return None
@@ -173,81 +462,185 @@ class SizeAwareDownloadHandler(FileSystemEventHandler):
         # This function serves as a hook if such a method were discovered.
         return None
 
+    def _scan_companions(self, file_path):
+        """
+        Lists the file's directory once and returns {name: path} for entries
+        that could be metadata companions. The individual parsers filter this
+        map instead of each re-scanning the same directory.
+        """
+        directory = os.path.dirname(file_path)
+        filename = os.path.basename(file_path)
+        companions = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name == filename:
+                        continue
+                    if name.endswith(self._COMPANION_SUFFIXES) or name.startswith(filename):
+                        companions[name] = entry.path
+        except OSError:
+            pass
+        return companions
+
     def _get_telegram_download_info(self, file_path):
         """
         Attempts to extract download information from Telegram's data.
         This is a highly speculative and experimental function. Telegram's internal
         data storage is complex and not officially documented for external parsing.
-        It tries to find metadata files or use SQLite if a .db file is found.
+        Companion metadata files are already covered by _check_companion_files;
+        this helper only consults the SQLite database, and only for files that
+        actually live inside a Telegram directory.
         """
         if not self.telegram_db_path or not os.path.exists(self.telegram_db_path):
             return None
-            
+
+        # A file outside Telegram's own folders cannot have a row in its DB,
+        # so don't pay for a query on every ~/Downloads file. Case-folded so
+        # the gate agrees with _classify_telegram_path on every platform.
+        path_lower = file_path.lower()
+        if not any(marker in path_lower for marker in self._TG_PATH_MARKERS):
+            return None
+
         filename = os.path.basename(file_path)
-        directory = os.path.dirname(file_path)
-        
-        # Method 1: Look for companion files (e.g., .json, .info) in the same directory
-        # Telegram sometimes creates small metadata files alongside downloads.
-        for file in os.listdir(directory):
-            if file.startswith(filename) and (file.endswith('.json') or file.endswith('.info')):
-                metadata_path = os.path.join(directory, file)
-                try:
-                    with open(metadata_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        # Try to parse as JSON
-                        try:
-                            data = json.loads(content)
-                            size_keys = ['size', 'total_size', 'content_length', 'filesize', 'length']
-                            for key in size_keys:
-                                if key in data and isinstance(data[key], (int, str)):
-                                    return int(data[key])
-                        except json.JSONDecodeError:
-                            # If not JSON, try regex for size patterns in plain text
-                            size_patterns = [
-                                r'"size":\s*(\d+)',
-                                r'"total_size":\s*(\d+)',
-                                r'"content_length":\s*(\d+)',
-                                r'size=(\d+)',
-                            ]
-                            for pattern in size_patterns:
-                                match = re.search(pattern, content, re.IGNORECASE)
-                                if match:
-                                    return int(match.group(1))
-                except Exception as e:
-                    self.app._log_message(f"Error reading Telegram companion file '{metadata_path}': {e}", "info")
-        
-        # Method 2: Attempt to query a SQLite database if self.telegram_db_path points to one
+
+        # Attempt to query a SQLite database if self.telegram_db_path points to one
         # This is highly speculative as table/column names are unknown.
         if self.telegram_db_path.endswith('.db'):
+            size = self._query_telegram_db(filename)
+            if size:
+                self.app._log_message(f"Found size in Telegram DB (speculative): {size}", "info")
+                return size
+
+        return None
+
+    # Parameterized so SQLite can reuse its prepared plan instead of
+    # re-parsing interpolated SQL on every lookup.
+    _TG_SQL = "SELECT size FROM downloads WHERE filename LIKE ? LIMIT 1"
+
+    def _query_telegram_db(self, filename):
+        """
+        Looks up a filename in the (speculative) Telegram downloads table.
+        Keeps a single read-only connection open across calls and caches
+        per-filename results, so each file costs at most one query.
+        """
+        with self._tg_lock:
+            if filename in self._tg_size_cache:
+                return self._tg_size_cache[filename]
+            if self._tg_conn_failed:
+                return None
             try:
-                conn = sqlite3.connect(self.telegram_db_path)
-                cursor = conn.cursor()
-                # This query is a guess and will likely fail without specific knowledge of schema
-                cursor.execute(f"SELECT size FROM downloads WHERE filename LIKE '%{filename}%' LIMIT 1")
+                if self._tg_conn is None:
+                    self._tg_conn = sqlite3.connect(
+                        f"file:{self.telegram_db_path}?mode=ro",
+                        uri=True, check_same_thread=False
+                    )
+                    # Belt and braces on top of mode=ro: refuse writes and
+                    # skip journal bookkeeping on someone else's database
+                    self._tg_conn.execute("PRAGMA query_only=1")
+                cursor = self._tg_conn.execute(self._TG_SQL, (f"%{filename}%",))
                 result = cursor.fetchone()
-                if result and result[0]:
-                    self.app._log_message(f"Found size in Telegram DB (speculative): {result[0]}", "info")
-                    return int(result[0])
+                size = int(result[0]) if result and result[0] else None
             except sqlite3.Error as e:
                 self.app._log_message(f"SQLite error accessing Telegram DB: {e}", "info")
-            finally:
-                if 'conn' in locals() and conn:
-                    conn.close()
-        
-        return None
+                # Schema is a guess; once it fails, stop re-probing for every file
+                self._tg_conn_failed = True
+                size = None
+            self._tg_size_cache[filename] = size
+            return size
+
+    def _close_telegram_db(self):
+        """Closes the long-lived Telegram DB connection, if one was opened."""
+        with self._tg_lock:
+            if self._tg_conn is not None:
+                self._tg_conn.close()
+                self._tg_conn = None
+
+    def _open_size_cache(self):
+        """
+        Opens (creating if needed) the tiny on-disk expected-size cache, so
+        repeated downloads of the same resource skip detection entirely on
+        later runs. WAL mode keeps readers and the writer from blocking.
+        """
+        try:
+            conn = sqlite3.connect(SIZE_CACHE_FILE, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS sz"
+                         "(k TEXT PRIMARY KEY, size INTEGER, ts INTEGER)")
+            return conn
+        except sqlite3.Error as e:
+            self.app._log_message(f"Expected-size cache unavailable: {e}", "info")
+            return None
+
+    def _size_cache_get(self, key):
+        """Returns a cached, non-stale expected size for the key, if any."""
+        if not self._size_cache:
+            return None
+        try:
+            with self._size_cache_lock:
+                row = self._size_cache.execute(
+                    "SELECT size FROM sz WHERE k=? AND ts>?",
+                    (key, int(time.time()) - SIZE_CACHE_TTL)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    def _size_cache_put(self, key, size):
+        """Stores a detected expected size for reuse across runs."""
+        if not self._size_cache:
+            return
+        try:
+            with self._size_cache_lock:
+                self._size_cache.execute(
+                    "INSERT OR REPLACE INTO sz VALUES (?, ?, ?)",
+                    (key, size, int(time.time())))
+        except sqlite3.Error:
+            pass
+
+    def _size_cache_delete(self, key):
+        """Drops a cached size proven wrong by an observed download."""
+        if not self._size_cache:
+            return
+        try:
+            with self._size_cache_lock:
+                self._size_cache.execute("DELETE FROM sz WHERE k=?", (key,))
+        except sqlite3.Error:
+            pass
 
     def _detect_expected_file_size(self, file_path):
+        """
+        Tries multiple methods to detect the expected final file size,
+        consulting the persistent cache before doing any real work.
+        """
+        filename = os.path.basename(file_path)
+        cached = self._size_cache_get(filename)
+        if cached:
+            self.app._log_message(f"Expected size from cache: {cached:,} bytes", "info")
+            return cached
+
+        expected_size = self._detect_expected_file_size_uncached(file_path)
+        if expected_size:
+            self._size_cache_put(filename, expected_size)
+        return expected_size
+
+    def _detect_expected_file_size_uncached(self, file_path):
         """
         Tries multiple methods to detect the expected final file size.
         """
         expected_size = None
-        
+
+        # Scan the directory once; both companion-based detectors filter
+        # the same entry map instead of re-listing the directory.
+        companions = self._scan_companions(file_path)
+
         # Method 1: Check for companion files with size info (most reliable for non-browser downloads)
-        expected_size = self._check_companion_files(file_path)
+        expected_size = self._check_companion_files(file_path, companions)
         if expected_size:
             self.app._log_message(f"Expected size from companion file: {expected_size:,} bytes", "info")
             return expected_size
-            
+
         # Method 2: Try to get info from Telegram (if applicable)
         if self._is_likely_telegram_file(file_path):
             expected_size = self._get_telegram_download_info(file_path)
@@ -266,107 +659,117 @@ class SizeAwareDownloadHandler(FileSystemEventHandler):
         
         return None
 
-    def _check_companion_files(self, file_path):
+    def _check_companion_files(self, file_path, companions=None):
         """
         Looks for companion files (e.g., .json, .info) that might contain size information.
         """
-        directory = os.path.dirname(file_path)
-        filename_base, _ = os.path.splitext(os.path.basename(file_path))
-        
+        filename = os.path.basename(file_path)
+        filename_base, _ = os.path.splitext(filename)
+        if companions is None:
+            companions = self._scan_companions(file_path)
+
         # Common patterns for companion files
         companion_patterns = [
-            f"{os.path.basename(file_path)}.info",
-            f"{os.path.basename(file_path)}.meta",
-            f"{os.path.basename(file_path)}.json",
-            f"{filename_base}.info",
-            f"{filename_base}.meta",
-            f"{filename_base}.json",
-            f".{os.path.basename(file_path)}.info", # Hidden files
-            f".{filename_base}.info",
+            f"{name}{suffix}"
+            for name in (filename, filename_base)
+            for suffix in self._COMPANION_SUFFIXES
         ]
-        
+        companion_patterns += [f".{filename}.info", f".{filename_base}.info"] # Hidden files
+
         for pattern in companion_patterns:
-            companion_path = os.path.join(directory, pattern)
-            if os.path.exists(companion_path):
+            companion_path = companions.get(pattern)
+            if companion_path:
+                suffix = os.path.splitext(pattern)[1].lower()
                 try:
                     with open(companion_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        # Try to parse as JSON first
+                        # Companion files are tiny; a bounded read keeps an
+                        # unexpectedly large one from being loaded whole.
+                        content = f.read(65536)
+
+                    # Regex first: the fused pattern matches the top-level
+                    # "size": 123 form directly, so the common case never
+                    # builds a JSON object tree just to read one integer.
+                    match = self._SIZE_RE.search(content)
+                    if match:
+                        return int(match.group(1))
+
+                    # Decode only JSON-looking content the regex missed
+                    # (e.g. a size key nested with unusual quoting); plain
+                    # .info/.meta files never pay for the decode attempt.
+                    if suffix == '.json' or (
+                            suffix not in ('.info', '.meta') and
+                            content[:64].lstrip()[:1] in ('{', '[')):
                         try:
-                            data = json.loads(content)
+                            data = _JSON_DECODER.decode(content)
+                        except ValueError:
+                            data = None
+                        if isinstance(data, dict):
                             # Look for common size-related keys
-                            size_keys = ['size', 'total_size', 'content_length', 'filesize', 'length']
-                            for key in size_keys:
-                                if key in data and isinstance(data[key], (int, str)):
+                            for key in self._SIZE_KEYS:
+                                value = data.get(key)
+                                if isinstance(value, (int, str)):
                                     try:
-                                        return int(data[key])
+                                        return int(value)
                                     except ValueError:
                                         continue # Skip if not a valid integer
-                        except json.JSONDecodeError:
-                            # If not JSON, try regex patterns on plain text
-                            size_patterns = [
-                                r'size[:=\s"]*(\d+)',
-                                r'length[:=\s"]*(\d+)',
-                                r'bytes[:=\s"]*(\d+)',
-                                r'total[:=\s"]*(\d+)',
-                            ]
-                            for pattern in size_patterns:
-                                match = re.search(pattern, content, re.IGNORECASE)
-                                if match:
-                                    try:
-                                        return int(match.group(1))
-                                    except ValueError:
-                                        continue
                 except Exception as e:
                     self.app._log_message(f"Error reading companion file '{companion_path}': {e}", "info")
                     continue
                     
         return None
 
-    def _is_file_temporary(self, file_path):
+    def _is_file_temporary(self, file_path, st=None, base=None):
         """
         Enhanced temporary file detection based on common patterns and extensions.
+        Callers that already hold a stat result or the basename pass them
+        through so this issues no extra syscall or string split.
         """
-        file_name = os.path.basename(file_path)
-        file_name_lower = file_name.lower()
-        
-        temp_extensions = (
-            ".tmp", ".crdownload", ".part", ".download", ".filepart",
-            ".idm", ".idm.tmp", ".idm.bak", ".dwnl", ".inprogress",
-            ".downloading", ".temp", ".partial", ".resume",
-            ".unconfirmed", ".opdownload", ".!ut", ".td", # .td for Telegram temp
-            ".crswap", ".swp", ".lock", ".~"
-        )
-        
-        for ext in temp_extensions:
-            if file_name_lower.endswith(ext):
-                return True
-        
-        # Common temporary file patterns in filenames
-        if (file_name_lower.startswith("downloading_") or 
-            file_name_lower.startswith("temp_") or
-            file_name_lower.startswith("~") or
-            "_downloading" in file_name_lower or
-            file_name.startswith(".")):  # Hidden files often used as temp
+        # The filename-based classification never changes for a given path,
+        # so memoize it; only the size probe below depends on current state.
+        name_is_temp = self._temp_name_cache.get(file_path)
+        if name_is_temp is None:
+            file_name = base if base is not None else os.path.basename(file_path)
+            file_name_lower = file_name.lower()
+            name_is_temp = bool(
+                # Single C-level scan over all extensions instead of a Python loop
+                file_name_lower.endswith(self._TEMP_EXTENSIONS) or
+                # Common temporary file patterns in filenames
+                # "." covers hidden files, which are often used as temp
+                file_name_lower.startswith(self._TEMP_PREFIXES + (".",)) or
+                "_downloading" in file_name_lower
+            )
+            self._temp_name_cache[file_path] = name_is_temp
+        if name_is_temp:
             return True
-            
+
         # Check file size - very small files might be incomplete
         try:
-            file_size = os.path.getsize(file_path)
-            if file_size < 1024:  # Less than 1KB, might be a stub
+            if st is None:
+                st = os.stat(file_path)
+            if st.st_size < 1024:  # Less than 1KB, might be a stub
                 return True
         except (OSError, FileNotFoundError):
             return True
-            
+
         return False
 
     def _is_likely_telegram_file(self, file_path):
         """
         Heuristic to check if a file path is likely related to Telegram downloads.
         Telegram often uses numerical or hash-like filenames without extensions initially.
+        The result is pure in the path, so it's memoized across re-queue passes.
         """
+        cached = self._telegram_path_cache.get(file_path)
+        if cached is not None:
+            return cached
+        result = self._classify_telegram_path(file_path)
+        self._telegram_path_cache[file_path] = result
+        return result
+
+    def _classify_telegram_path(self, file_path):
+        """Uncached body of the Telegram-path heuristic."""
         path_lower = file_path.lower()
-        if "telegram desktop" in path_lower or "tdata" in path_lower:
+        if any(marker in path_lower for marker in self._TG_PATH_MARKERS):
             return True
             
         file_name = os.path.basename(file_path)
@@ -383,38 +786,56 @@ class SizeAwareDownloadHandler(FileSystemEventHandler):
         Adds a file to the processing queue if it's not a temporary file.
         Attempts to detect expected size and updates GUI.
         """
-        if not self._is_file_temporary(file_path):
+        # Bursts of created/moved events for the same path collapse into one entry
+        if file_path in self._inflight:
+            return
+        # One stat serves both the temp heuristic and the size threshold
+        try:
+            st = os.stat(file_path)
+        except (OSError, FileNotFoundError):
+            return
+        # The basename is needed by the temp check, the queue record and
+        # every log line below; split it out of the path exactly once.
+        base = os.path.basename(file_path)
+        if not self._is_file_temporary(file_path, st=st, base=base):
             # Check minimum file size threshold
-            try:
-                file_size = os.path.getsize(file_path)
-                if file_size < MIN_FILE_SIZE_MB * 1024 * 1024:  # Convert MB to bytes
-                    self.app._log_message(f"Skipped small file: {os.path.basename(file_path)} ({file_size:,} bytes)", "info")
-                    return
-            except (OSError, FileNotFoundError):
+            if st.st_size < MIN_FILE_SIZE_MB * 1024 * 1024:  # Convert MB to bytes
+                # Skipped files never queue, so release the memo here the
+                # same way the temp branch does
+                self._temp_name_cache.pop(file_path, None)
+                self.app._log_message(f"Skipped small file: {base} ({st.st_size:,} bytes)", "info")
                 return
                 
-            self.file_creation_times[file_path] = time.time()
-            
+            item = PendingDownload(
+                path=file_path,
+                name=base,
+                directory=os.path.dirname(file_path),
+                created_at=time.time(),
+            )
+
             # Try to detect expected file size
             expected_size = self._detect_expected_file_size(file_path)
             if expected_size:
-                self.file_expected_sizes[file_path] = expected_size
-                self.app.update_status(f"Detected file: {os.path.basename(file_path)} (Expected: {expected_size:,} bytes)")
-                self.app._log_message(f"File added with expected size: {os.path.basename(file_path)} -> {expected_size:,} bytes", "info")
+                item.expected_size = expected_size
+                self.app.update_status(f"Detected file: {item.name} (Expected: {expected_size:,} bytes)")
+                self.app._log_message(f"File added with expected size: {item.name} -> {expected_size:,} bytes", "info")
             else:
-                self.app.update_status(f"Detected file: {os.path.basename(file_path)} (Size unknown)")
-                self.app._log_message(f"File added without size info: {os.path.basename(file_path)}", "info")
-                
-            self.download_queue.append(file_path)
-            
-            if not self.processing_thread or not self.processing_thread.is_alive():
-                self.stop_processing_event.clear()
-                self.processing_thread = threading.Thread(target=self._process_downloads)
-                self.processing_thread.daemon = True # Allow thread to exit with main app
-                self.processing_thread.start()
+                self.app.update_status(f"Detected file: {item.name} (Size unknown)")
+                self.app._log_message(f"File added without size info: {item.name}", "info")
+
+            self._inflight.add(file_path)
+            self.pending[file_path] = item
+            with self._queue_cv:
+                self.download_queue.append(item)
+                self._queue_cv.notify()
         else:
-            self.app.update_status(f"Skipped temporary file: {os.path.basename(file_path)}")
-            self.app._log_message(f"Skipped temporary file: {os.path.basename(file_path)}", "info")
+            # Temp-classified paths never reach the queue, so nothing later
+            # runs _cleanup_file_data for them; evict the memo here or a
+            # session's stream of .crdownload/.part events grows the cache
+            # for as long as monitoring runs
+            self._temp_name_cache.pop(file_path, None)
+            self.app.update_status(f"Skipped temporary file: {base}")
+            self.app._log_message(f"Skipped temporary file: {base}", "info")
 
     def on_created(self, event):
         """Called when a file or directory is created."""
@@ -430,154 +851,259 @@ class SizeAwareDownloadHandler(FileSystemEventHandler):
             # When a file is moved/renamed, the destination path is the final, completed file.
             self._add_to_queue_if_not_temp(event.dest_path)
 
+    def on_modified(self, event):
+        """
+        Records write activity for files already being tracked. The
+        stability check reads these timestamps instead of sleeping and
+        re-stat'ing to observe changes itself.
+        """
+        if not event.is_directory and event.src_path in self._inflight:
+            self.file_last_modified[event.src_path] = time.time()
+
     def _process_downloads(self):
         """
         Processes files in the download queue to determine if they are complete.
-        This runs in a separate thread to avoid blocking the GUI.
-        Uses size-aware completion detection.
+        This is the body of the single long-lived worker thread; it sleeps on
+        the condition variable while the queue is empty so no GUI blocking or
+        per-download thread churn occurs.
         """
-        while self.download_queue and not self.stop_processing_event.is_set():
-            file_path = self.download_queue.pop(0) # Get the first file in queue
-            
-            if not os.path.exists(file_path):
-                self.app._log_message(f"File disappeared before processing: {os.path.basename(file_path)}", "info")
-                self._cleanup_file_data(file_path)
+        while not self.stop_processing_event.is_set():
+            expired = []
+            with self._queue_cv:
+                item = None
+                while item is None:
+                    if self.stop_processing_event.is_set():
+                        return
+                    # Arrivals are naturally ordered by creation time, so
+                    # every expired entry sits at the head: drain them in
+                    # one pass instead of rediscovering each per cycle.
+                    # Only collect here: logging marshals through the Tk
+                    # loop, and stop_monitoring blocks on this lock from
+                    # that same loop, so logging under it can deadlock.
+                    now = time.time()
+                    while (self.download_queue and
+                           now - self.download_queue[0].created_at > MAX_PROCESSING_TIME):
+                        expired.append(self.download_queue.popleft())
+                    if expired:
+                        break # Handle the timeouts with the lock released
+                    if self.download_queue:
+                        # Fresh arrivals take priority over rechecks
+                        item = self.download_queue.popleft()
+                    elif self._retry_heap and self._retry_heap[0][0] <= time.time():
+                        item = heapq.heappop(self._retry_heap)[2]
+                    else:
+                        # Sleep until the earliest recheck is due (capped so
+                        # a stop request is still noticed promptly)
+                        if self._retry_heap:
+                            timeout = min(1, max(0, self._retry_heap[0][0] - time.time()))
+                        else:
+                            timeout = 1
+                        self._queue_cv.wait(timeout=timeout)
+
+            for timed_out in expired:
+                self.app._log_message(f"Processing timeout for: {timed_out.name}", "info")
+                self._cleanup_file_data(timed_out.path)
+            if item is None:
                 continue
-                
-            # Check if file has been processing too long
-            creation_time = self.file_creation_times.get(file_path, time.time())
-            if time.time() - creation_time > MAX_PROCESSING_TIME:
-                self.app._log_message(f"Processing timeout for: {os.path.basename(file_path)}", "info")
-                self._cleanup_file_data(file_path)
+
+            if not os.path.exists(item.path):
+                self.app._log_message(f"File disappeared before processing: {item.name}", "info")
+                self._cleanup_file_data(item.path)
                 continue
-                
-            self.app.update_status(f"Checking download status for: {os.path.basename(file_path)}")
-            if self._is_download_complete_size_aware(file_path):
-                self.app.notify_download_complete(file_path)
-                self._cleanup_file_data(file_path)
+
+            # Retry-heap items are ordered by due time, not creation time,
+            # so their timeout still needs the per-item check
+            if time.time() - item.created_at > MAX_PROCESSING_TIME:
+                self.app._log_message(f"Processing timeout for: {item.name}", "info")
+                self._cleanup_file_data(item.path)
+                continue
+
+            self.app.update_status(f"Checking download status for: {item.name}")
+            if self._is_download_complete_size_aware(item):
+                self.app.notify_download_complete(item.path, item.final_size)
+                self._cleanup_file_data(item.path)
             else:
-                # If not complete, put it back to re-check later
-                self.download_queue.append(file_path)
-                time.sleep(2) # Wait a bit before re-checking (longer for size-aware)
+                # Not complete: schedule a recheck instead of sleeping, so
+                # other queued files are not held up behind this one
+                with self._queue_cv:
+                    heapq.heappush(self._retry_heap,
+                                   (time.time() + 2, next(self._retry_seq), item))
 
-    def _is_download_complete_size_aware(self, file_path):
+    def _is_download_complete_size_aware(self, item):
         """
         Enhanced completion check using expected file size when available.
         Falls back to stability-based detection if expected size is unknown.
         """
-        if not os.path.exists(file_path):
+        if not os.path.exists(item.path):
             return False
 
         try:
-            current_size = os.path.getsize(file_path)
-            expected_size = self.file_expected_sizes.get(file_path)
-            
+            st = os.stat(item.path)
+            current_size = st.st_size
+            expected_size = item.expected_size
+
             # If we know the expected size, use it for precise detection
             if expected_size:
                 # Allow a small tolerance for file system quirks or minor differences
                 # (e.g., 0.1% tolerance or a few bytes)
                 tolerance = max(1024, expected_size * 0.001) # 1KB or 0.1%
                 if abs(current_size - expected_size) <= tolerance:
-                    # Double-check that file is stable after reaching expected size
-                    # This helps ensure it's not still being written to.
-                    time.sleep(1)
-                    final_size = os.path.getsize(file_path)
-                    if abs(final_size - expected_size) <= tolerance:
+                    # The writer is done once the file has reached the expected
+                    # size and hasn't been modified for a second — the mtime
+                    # already tells us, so no sleep-and-restat stall is needed.
+                    if time.time() - st.st_mtime > 1.0:
                         progress_pct = (current_size / expected_size) * 100 if expected_size > 0 else 100
-                        self.app._log_message(f"Size match confirmed: {os.path.basename(file_path)} ({progress_pct:.1f}%)", "info")
+                        item.final_size = current_size
+                        self.app._log_message(f"Size match confirmed: {item.name} ({progress_pct:.1f}%)", "info")
                         return True
+                    return False
+                elif current_size > expected_size + tolerance:
+                    # The file overshot the expectation, so the expected
+                    # size is provably wrong (e.g. a stale cache entry from
+                    # a different file with the same name). Drop it — both
+                    # from this item and from the persistent cache — and
+                    # let stability detection finish the job.
+                    self.app._log_message(
+                        f"Expected size for {item.name} was wrong "
+                        f"({current_size:,} > {expected_size:,}); "
+                        "falling back to stability detection", "info")
+                    item.expected_size = None
+                    self._size_cache_delete(item.name)
+                    return self._is_download_complete_stability(item)
                 else:
+                    # Still short of the expectation. If the writer has
+                    # gone quiet well past the stability window, the
+                    # expectation is provably stale too (a smaller file
+                    # reusing a cached name): drop it like the overshoot
+                    # case so the download isn't retried into the timeout.
+                    last_event = self.file_last_modified.get(item.path, 0.0)
+                    if time.time() - max(st.st_mtime, last_event) > 10:
+                        self.app._log_message(
+                            f"Expected size for {item.name} was wrong "
+                            f"({current_size:,} < {expected_size:,} with no "
+                            "write activity); falling back to stability "
+                            "detection", "info")
+                        item.expected_size = None
+                        self._size_cache_delete(item.name)
+                        return self._is_download_complete_stability(item)
                     # Show progress if we know expected size
                     progress_pct = (current_size / expected_size) * 100 if expected_size > 0 else 0
-                    self.app.update_status(f"Downloading: {os.path.basename(file_path)} ({progress_pct:.1f}% - {current_size:,}/{expected_size:,} bytes)")
+                    self.app.update_status(f"Downloading: {item.name} ({progress_pct:.1f}% - {current_size:,}/{expected_size:,} bytes)")
                     return False
-            
+
             # Fall back to stability-based detection if no expected size was found
-            return self._is_download_complete_stability(file_path)
-            
+            return self._is_download_complete_stability(item)
+
         except Exception as e:
-            self.app._log_message(f"Error in size-aware check for {os.path.basename(file_path)}: {e}", "error")
+            self.app._log_message(f"Error in size-aware check for {item.name}: {e}", "error")
             return False
 
-    def _is_download_complete_stability(self, file_path, check_interval=2, stable_checks=3):
+    def _is_download_complete_stability(self, item, quiet_period=2):
         """
-        Fallback stability-based completion detection.
-        Checks if file size and modification time remain stable over several intervals.
+        Fallback event-driven completion detection. on_modified keeps
+        file_last_modified fresh, so a single non-blocking stat per recheck
+        decides whether the file has grown or gone quiet; the retry heap
+        brings the file back when its next check is due instead of this
+        method sleeping through several intervals.
         """
-        creation_time = self.file_creation_times.get(file_path, time.time())
-        time_since_creation = time.time() - creation_time
-        
+        time_since_creation = time.time() - item.created_at
+
         # For very new files, especially Telegram ones, give them a moment to start
-        if self._is_likely_telegram_file(file_path) and time_since_creation < 5:
+        if self._is_likely_telegram_file(item.path) and time_since_creation < 5:
             return False
 
-        last_size = -1
-        last_modified = -1
-        
-        for i in range(stable_checks):
-            try:
-                current_size = os.path.getsize(file_path)
-                current_modified = os.path.getmtime(file_path)
-                
-                if (current_size == last_size and 
-                    current_modified == last_modified and 
-                    current_size > 0): # Ensure it's not a zero-byte file that never grew
-                    
-                    # Add a small buffer time after stability is detected to be extra sure
-                    time_since_modified = time.time() - current_modified
-                    if time_since_modified > 2: # File hasn't been modified for at least 2 seconds
-                        self.app._log_message(f"Stability check passed for: {os.path.basename(file_path)}", "info")
-                        return True
-                
-                last_size = current_size
-                last_modified = current_modified
-                time.sleep(check_interval)
-                
-            except FileNotFoundError:
-                # If file disappears during checks, it might have been moved/completed
-                # Consider it complete if it existed for at least one check (i.e., i > 0)
-                self.app._log_message(f"File disappeared during stability check: {os.path.basename(file_path)}", "info")
-                return i > 0
-            except Exception as e:
-                self.app._log_message(f"Error during stability check for {os.path.basename(file_path)}: {e}", "error")
-                return False
+        try:
+            st = os.stat(item.path)
+        except FileNotFoundError:
+            # If the file disappears between checks, it was likely moved into
+            # place; consider it complete if we ever saw real content.
+            self.app._log_message(f"File disappeared during stability check: {item.name}", "info")
+            return item.last_size > 0
+        except Exception as e:
+            self.app._log_message(f"Error during stability check for {item.name}: {e}", "error")
+            return False
+
+        now = time.time()
+        last_event = self.file_last_modified.get(item.path, 0.0)
+        quiet_for = now - max(st.st_mtime, last_event)
+        if (st.st_size > 0 and # Ensure it's not a zero-byte file that never grew
+                st.st_size == item.last_size and
+                quiet_for > quiet_period):
+            item.final_size = st.st_size
+            self.app._log_message(f"Stability check passed for: {item.name}", "info")
+            return True
 
-        self.app._log_message(f"Stability check failed after {stable_checks} attempts for: {os.path.basename(file_path)}", "info")
+        item.last_size = st.st_size
         return False
 
     def _cleanup_file_data(self, file_path):
         """Cleans up tracking data for a file after it's processed."""
-        self.file_creation_times.pop(file_path, None)
-        self.file_expected_sizes.pop(file_path, None)
+        self.pending.pop(file_path, None)
+        self._inflight.discard(file_path)
+        self._temp_name_cache.pop(file_path, None)
+        self._telegram_path_cache.pop(file_path, None)
+        self.file_last_modified.pop(file_path, None)
 
     def stop_processing(self):
         """Signals the processing thread to stop and cleans up."""
         self.stop_processing_event.set()
+        with self._queue_cv:
+            self._queue_cv.notify_all() # Wake the worker so it can observe the stop
         if self.processing_thread and self.processing_thread.is_alive():
             # Give it a moment to finish current task, then join
             self.processing_thread.join(timeout=5)
-        self.file_creation_times.clear()
-        self.file_expected_sizes.clear()
+        self._close_telegram_db()
+        if self._size_cache:
+            with self._size_cache_lock:
+                self._size_cache.close()
+                self._size_cache = None
+        self.pending.clear()
+        self._retry_heap.clear()
+        self._inflight.clear()
+        self.file_last_modified.clear()
 
 # --- Main Application Class ---
 class DownloadNotifierApp:
     def __init__(self, master):
         self.master = master
         master.title(f"Download Notifier Pro v{APP_VERSION}")
-        master.geometry("900x700")
+        master.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         master.resizable(True, True)
         master.minsize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
 
         # Application state
         self.monitor_path = tk.StringVar(value=DEFAULT_DOWNLOAD_DIR)
+        # Ordered list + set mirror of the entry: O(1) duplicate checks on
+        # quick-add instead of substring scans of the joined string. The
+        # cached joined value detects hand-edits so the mirror resyncs.
+        self._monitor_paths = [DEFAULT_DOWNLOAD_DIR]
+        self._monitor_paths_set = {DEFAULT_DOWNLOAD_DIR}
+        self._monitor_paths_str = DEFAULT_DOWNLOAD_DIR
         self.observers = []
         self.event_handler = None
         self.is_monitoring = False
-        self.download_history = []
+        # Bounded so week-long sessions can't grow exports and refreshes
+        # without limit; evicted records are spilled to a JSONL file
+        self.download_history = deque(maxlen=10_000)
+        self._history_spill = None
+        # Single worker serializes export writes off the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="export-io")
+        # Treeview item ids currently shown in Recent Downloads, newest
+        # first, so refreshes only insert entries the tree hasn't seen.
+        # Progress is tracked with a monotonic appended-record counter:
+        # len() stops moving once the bounded history deque is full.
+        self._recent_ids = deque(maxlen=50)
+        self._history_seq = 0
+        self._last_history_seq = 0
+        self._stats_pending = False
+        session_start = time.time()
         self.statistics = {
             "total_downloads": 0,
             "total_size": 0,
-            "session_start": time.time()
+            "session_start": session_start,
+            # Cached once so exports don't re-derive it every time
+            "session_start_iso": datetime.fromtimestamp(session_start).isoformat()
         }
         
         # Settings
@@ -623,12 +1149,9 @@ class DownloadNotifierApp:
         # Notifications history
         self.notifications_history = []
         
-        # Initialize Pygame mixer
-        if not pygame.mixer.get_init():
-            try:
-                pygame.mixer.init()
-            except Exception as e:
-                print(f"Could not initialize Pygame mixer in app: {e}")
+        # The pygame mixer is initialized lazily by _get_alarm_sound() on
+        # the first playback, so construction never blocks on audio-driver
+        # startup (and never pays for it at all when sound stays off).
 
         # Setup UI
         self.setup_styles()
@@ -643,6 +1166,71 @@ class DownloadNotifierApp:
         
         # Status bar timer
         self.status_timer = None
+        self._last_status = None
+        self._last_status_level = None
+
+        # Flattened (widget, class) cache for theme switches, built lazily,
+        # plus the in-progress chunked application state
+        self._themed_widgets = None
+        self._theme_apply_state = None
+
+        # Batched log pipeline: producers append to a deque (atomic under the
+        # GIL) and a single deferred flush renders each burst in one pass
+        self._log_queue = deque()
+        self._log_flush_scheduled = False
+
+        # Completion notifications are queued by the worker and drained in
+        # one batch, so a multi-file burst raises one alarm and one popup
+        self._notify_queue = queue.Queue()
+        self._notify_scheduled = False
+
+        # Worker -> UI hand-off for status updates: one bound virtual event
+        # instead of a new lambda + after() entry per message
+        self._ui_queue = queue.Queue()
+        self.master.bind("<<UIWork>>", self._drain_ui_queue)
+
+        # Status-label debounce: bursts collapse to one config/redraw
+        self._pending_status = None
+        self._status_flush_scheduled = False
+
+        # One deferred scroll per burst of log messages instead of a forced
+        # layout recompute (see END) on every insert
+        self._scroll_scheduled = False
+
+        # Rich activity-log entries queue here and land in the widgets in
+        # one batched insert per 100ms window
+        self._rich_log_queue = deque()
+        self._rich_log_flush_scheduled = False
+        # Plain-text mirror of the activity log; saving reads this instead
+        # of marshalling the whole Text widget back through Tcl
+        self._log_lines = deque(maxlen=50_000)
+
+        # Alarm sound decoded once on first play and reused for every alarm.
+        # _alarm_playing mirrors the channel state so UI code never has to
+        # query SDL's mixer lock just to know whether an alarm is sounding.
+        self._alarm_sound = None
+        self._alarm_channel = None
+        self._alarm_playing = False
+        self._alarm_timer = None # Pending end-of-playback after() id
+
+        # Persistent activity log. A QueueHandler decouples callers from disk
+        # latency; one listener thread drains into a rotating file so burst
+        # events never stall the monitoring thread on I/O.
+        self._file_log = logging.getLogger("download_notifier")
+        self._log_listener = None
+        if not self._file_log.handlers:
+            try:
+                disk_q = queue.Queue(-1)
+                file_handler = logging.handlers.RotatingFileHandler(
+                    "notifier.log", maxBytes=1 << 20, backupCount=3, encoding="utf-8")
+                file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+                self._file_log.addHandler(logging.handlers.QueueHandler(disk_q))
+                self._file_log.setLevel(logging.INFO)
+                self._file_log.propagate = False
+                self._log_listener = logging.handlers.QueueListener(disk_q, file_handler)
+                self._log_listener.start()
+            except OSError as e:
+                print(f"Could not open notifier.log for writing: {e}")
 
     def load_settings(self):
         """Load settings from JSON file"""
@@ -713,6 +1301,20 @@ class DownloadNotifierApp:
                            padding=(20, 10),
                            font=('Segoe UI', 10))
 
+        # Base ttk classes: one Style reconfigure here re-themes every ttk
+        # widget on its next redraw, so the recursive widget walk never has
+        # to touch them individually (ttk ignores bg/fg config anyway)
+        self.style.configure('TFrame', background=theme["bg"])
+        self.style.configure('TLabel', background=theme["bg"], foreground=theme["fg"])
+        self.style.configure('TButton', background=theme["secondary_bg"], foreground=theme["fg"])
+        self.style.configure('TEntry',
+                           fieldbackground=theme["entry_bg"],
+                           foreground=theme["entry_fg"])
+        self.style.configure('Vertical.TScrollbar',
+                           background=theme["secondary_bg"],
+                           troughcolor=theme["bg"])
+        self.style.map('TButton', background=[('active', theme["accent"])])
+
     def refresh_ui(self):
         """Refresh the UI components"""
         self.apply_theme()
@@ -818,15 +1420,41 @@ class DownloadNotifierApp:
         
         # Tab 6: Notifications History  
         self.create_notifications_tab()
+
+        # Tab 7: Settings - placeholder only; its ~20 widgets are built the
+        # first time the user actually opens the tab
+        self.create_settings_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event=None):
+        """Builds lazily-constructed tab contents on first selection."""
+        if (not self._settings_built and
+                self.notebook.select() == str(self._settings_frame)):
+            self._settings_built = True
+            self._build_settings_contents()
+            # The new widgets invalidate the cached theme list; restyle them
+            self._themed_widgets = None
+            self.apply_theme()
     
+    # Shared section-frame styling; one tuple allocation at class load
+    # instead of a fresh font literal per LabelFrame construction
+    _SECTION_FONT = ("Segoe UI", 12, "bold")
+    _SUBSECTION_FONT = ("Segoe UI", 11, "bold")
+
+    def _make_section(self, parent, title, font=None, padx=15, pady=10):
+        """Returns a LabelFrame with the app's standard section styling."""
+        return tk.LabelFrame(parent, text=title,
+                             font=font or self._SECTION_FONT,
+                             padx=padx, pady=pady)
+
     def create_monitor_tab(self):
         """Create the main monitoring tab"""
         monitor_frame = tk.Frame(self.notebook)
         self.notebook.add(monitor_frame, text="📁 Monitor")
         
         # Directory selection section
-        dir_section = tk.LabelFrame(monitor_frame, text="📂 Directories to Monitor",
-                                   font=("Segoe UI", 11, "bold"), padx=15, pady=10)
+        dir_section = self._make_section(monitor_frame, "📂 Directories to Monitor",
+                                         font=self._SUBSECTION_FONT)
         dir_section.pack(fill="x", padx=10, pady=10)
         
         # Path entry with modern styling
@@ -847,6 +1475,7 @@ class DownloadNotifierApp:
                                       command=self.browse_directory,
                                       font=("Segoe UI", 10), relief="raised", bd=1,
                                       padx=15, pady=8)
+        self.browse_button._theme_role = "browse"
         self.browse_button.pack(side="right")
         
         # Enhanced Quick path buttons with more creative options
@@ -860,15 +1489,9 @@ class DownloadNotifierApp:
         row1_frame = tk.Frame(quick_paths_frame)
         row1_frame.pack(fill="x", pady=2)
         
-        quick_paths_row1 = [
-            ("📥 Downloads", os.path.join(os.path.expanduser("~"), "Downloads")),
-            ("🖥️ Desktop", os.path.join(os.path.expanduser("~"), "Desktop")),
-            ("📄 Documents", os.path.join(os.path.expanduser("~"), "Documents"))
-        ]
-        
-        for name, path in quick_paths_row1:
+        for name, path in _QUICK_PATHS_ROW1:
             btn = tk.Button(row1_frame, text=name,
-                           command=lambda p=path: self.add_quick_path(p),
+                           command=partial(self.add_quick_path, path),
                            font=("Segoe UI", 9), relief="raised", bd=2,
                            padx=12, pady=4)
             btn.pack(side="left", padx=3, expand=True, fill="x")
@@ -877,22 +1500,17 @@ class DownloadNotifierApp:
         row2_frame = tk.Frame(quick_paths_frame)
         row2_frame.pack(fill="x", pady=2)
         
-        quick_paths_row2 = [
-            ("🎵 Music", os.path.join(os.path.expanduser("~"), "Music")),
-            ("🎬 Videos", os.path.join(os.path.expanduser("~"), "Videos")),
-            ("🖼️ Pictures", os.path.join(os.path.expanduser("~"), "Pictures"))
-        ]
         
-        for name, path in quick_paths_row2:
+        for name, path in _QUICK_PATHS_ROW2:
             btn = tk.Button(row2_frame, text=name,
-                           command=lambda p=path: self.add_quick_path(p),
+                           command=partial(self.add_quick_path, path),
                            font=("Segoe UI", 9), relief="raised", bd=2,
                            padx=12, pady=4)
             btn.pack(side="left", padx=3, expand=True, fill="x")
         
         # Control buttons section
-        control_section = tk.LabelFrame(monitor_frame, text="🎮 Control Panel",
-                                       font=("Segoe UI", 11, "bold"), padx=15, pady=10)
+        control_section = self._make_section(monitor_frame, "🎮 Control Panel",
+                                             font=self._SUBSECTION_FONT)
         control_section.pack(fill="x", padx=10, pady=10)
         
         buttons_frame = tk.Frame(control_section)
@@ -903,6 +1521,7 @@ class DownloadNotifierApp:
                                      command=self.start_monitoring,
                                      font=("Segoe UI", 12, "bold"),
                                      relief="raised", bd=2, padx=20, pady=12)
+        self.start_button._theme_role = "start"
         self.start_button.pack(side="left", expand=True, fill="x", padx=(0, 5))
         
         self.stop_button = tk.Button(buttons_frame, text="⏹️ Stop Monitoring",
@@ -910,6 +1529,7 @@ class DownloadNotifierApp:
                                     font=("Segoe UI", 12, "bold"),
                                     relief="raised", bd=2, padx=20, pady=12,
                                     state="disabled")
+        self.stop_button._theme_role = "stop"
         self.stop_button.pack(side="left", expand=True, fill="x", padx=(5, 0))
         
         # Additional controls
@@ -921,6 +1541,7 @@ class DownloadNotifierApp:
                                           font=("Segoe UI", 10),
                                           relief="raised", bd=1, padx=15, pady=6,
                                           state="disabled")
+        self.stop_alarm_button._theme_role = "stop_alarm"
         self.stop_alarm_button.pack(side="left", padx=(0, 10))
         
         self.test_sound_button = tk.Button(extra_controls, text="🔊 Test Sound",
@@ -930,13 +1551,18 @@ class DownloadNotifierApp:
         self.test_sound_button.pack(side="left", padx=(0, 10))
         
         # Status display
-        status_section = tk.LabelFrame(monitor_frame, text="📊 Current Status",
-                                      font=("Segoe UI", 11, "bold"), padx=15, pady=10)
+        status_section = self._make_section(monitor_frame, "📊 Current Status",
+                                            font=self._SUBSECTION_FONT)
         status_section.pack(fill="both", expand=True, padx=10, pady=10)
         
         self.status_text = tk.Text(status_section, height=6, wrap="word",
-                                  font=("Consolas", 9), relief="solid", bd=1,
-                                  state="disabled")
+                                  font=("Consolas", 9), relief="solid", bd=1)
+        # Kept in normal state so writers skip the enable/disable cycle;
+        # key and paste events are swallowed to keep it read-only
+        self.status_text.bind("<Key>", lambda e: "break")
+        self.status_text.bind("<Button-2>", lambda e: "break")
+        # More specific sequence wins over <Key>, so copy still works
+        self.status_text.bind("<Control-c>", lambda e: None)
         self.status_text.pack(fill="both", expand=True, pady=5)
         
     def create_activity_tab(self):
@@ -970,12 +1596,14 @@ class DownloadNotifierApp:
                                          command=self.clear_log,
                                          font=("Segoe UI", 9), relief="raised", bd=1,
                                          padx=10, pady=5)
+        self.clear_log_button._theme_role = "log_action"
         self.clear_log_button.pack(side="left", padx=(0, 5))
         
         self.save_log_button = tk.Button(actions_frame, text="💾 Save",
                                         command=self.save_log,
                                         font=("Segoe UI", 9), relief="raised", bd=1,
                                         padx=10, pady=5)
+        self.save_log_button._theme_role = "log_action"
         self.save_log_button.pack(side="left", padx=(0, 5))
         
         self.export_button = tk.Button(actions_frame, text="📤 Export",
@@ -990,15 +1618,34 @@ class DownloadNotifierApp:
         
         # Create text widget with scrollbars
         self.log_text = tk.Text(log_display_frame, wrap="word", font=("Consolas", 9),
-                               relief="solid", bd=1, state="disabled")
+                               relief="solid", bd=1)
+        # Read-only via bindings rather than state flips: every insert used
+        # to pay a disabled->normal->disabled reconfigure round trip
+        self.log_text.bind("<Key>", lambda e: "break")
+        self.log_text.bind("<Button-2>", lambda e: "break")
+        # More specific sequence wins over <Key>, so copy still works
+        self.log_text.bind("<Control-c>", lambda e: None)
         self.log_text.pack(side="left", fill="both", expand=True)
         
-        # Configure text tags for different log levels
-        self.log_text.tag_config("download", foreground="#4CAF50", font=("Consolas", 9, "bold"))
-        self.log_text.tag_config("error", foreground="#f44336", font=("Consolas", 9, "bold"))
-        self.log_text.tag_config("warning", foreground="#ff9800", font=("Consolas", 9, "bold"))
-        self.log_text.tag_config("info", foreground="#2196F3")
-        self.log_text.tag_config("timestamp", foreground="#666666", font=("Consolas", 8))
+        # Configure text tags for different log levels. Named Font objects
+        # are parsed by Tk once and shared; inline tuples would be
+        # re-parsed into a fresh Tk font per tag_configure call.
+        self._log_bold_font = tkfont.Font(family="Consolas", size=9, weight="bold")
+        self._log_ts_font = tkfont.Font(family="Consolas", size=8)
+        for tag, color in (("download", "#4CAF50"),
+                           ("error", "#f44336"),
+                           ("warning", "#ff9800")):
+            self.log_text.tag_configure(tag, foreground=color,
+                                        font=self._log_bold_font)
+        self.log_text.tag_configure("info", foreground="#2196F3")
+        self.log_text.tag_configure("timestamp", foreground="#666666",
+                                    font=self._log_ts_font)
+
+        # Hot-path handles for the batched flush: calling straight into the
+        # Tcl interpreter skips the tkinter wrapper's per-call argument
+        # packing, which adds up across a burst's per-line tag adds
+        self._log_text_path = str(self.log_text)
+        self._tk_call = self.log_text.tk.call
         
         # Scrollbars
         v_scrollbar = tk.Scrollbar(log_display_frame, orient="vertical", command=self.log_text.yview)
@@ -1019,8 +1666,7 @@ class DownloadNotifierApp:
         stats_container.pack(fill="both", expand=True, padx=15, pady=15)
         
         # Session statistics
-        session_frame = tk.LabelFrame(stats_container, text="📈 Session Statistics",
-                                     font=("Segoe UI", 12, "bold"), padx=15, pady=10)
+        session_frame = self._make_section(stats_container, "📈 Session Statistics")
         session_frame.pack(fill="x", pady=(0, 15))
         
         self.create_stat_row(session_frame, "Session Duration:", "session_duration")
@@ -1029,8 +1675,7 @@ class DownloadNotifierApp:
         self.create_stat_row(session_frame, "Average File Size:", "avg_size")
         
         # Recent downloads
-        recent_frame = tk.LabelFrame(stats_container, text="📥 Recent Downloads",
-                                    font=("Segoe UI", 12, "bold"), padx=15, pady=10)
+        recent_frame = self._make_section(stats_container, "📥 Recent Downloads")
         recent_frame.pack(fill="both", expand=True)
         
         # Create treeview for recent downloads
@@ -1069,9 +1714,14 @@ class DownloadNotifierApp:
                  font=("Segoe UI", 10), relief="raised", bd=1, padx=15, pady=5).pack(side="left", padx=(10, 0))
     
     def create_settings_tab(self):
-        """Create the settings tab"""
-        settings_frame = tk.Frame(self.notebook)
-        self.notebook.add(settings_frame, text="⚙️ Settings")
+        """Create the settings tab placeholder; contents are built lazily."""
+        self._settings_frame = tk.Frame(self.notebook)
+        self.notebook.add(self._settings_frame, text="⚙️ Settings")
+        self._settings_built = False
+
+    def _build_settings_contents(self):
+        """Builds the settings widgets on first visit to the tab."""
+        settings_frame = self._settings_frame
         
         # Create scrollable frame
         canvas = tk.Canvas(settings_frame)
@@ -1087,8 +1737,7 @@ class DownloadNotifierApp:
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Notification settings
-        notif_frame = tk.LabelFrame(scrollable_frame, text="🔔 Notifications",
-                                   font=("Segoe UI", 12, "bold"), padx=15, pady=10)
+        notif_frame = self._make_section(scrollable_frame, "🔔 Notifications")
         notif_frame.pack(fill="x", padx=15, pady=(15, 10))
         
         self.sound_checkbox = tk.Checkbutton(notif_frame, text="🔊 Enable sound notifications",
@@ -1102,8 +1751,7 @@ class DownloadNotifierApp:
         self.popup_checkbox.pack(anchor="w", pady=2)
         
         # File filtering settings
-        filter_frame = tk.LabelFrame(scrollable_frame, text="🎯 File Filtering",
-                                    font=("Segoe UI", 12, "bold"), padx=15, pady=10)
+        filter_frame = self._make_section(scrollable_frame, "🎯 File Filtering")
         filter_frame.pack(fill="x", padx=15, pady=10)
         
         size_frame = tk.Frame(filter_frame)
@@ -1118,8 +1766,7 @@ class DownloadNotifierApp:
         self.size_spinbox.pack(side="left", padx=(10, 0))
         
         # Advanced settings
-        advanced_frame = tk.LabelFrame(scrollable_frame, text="🔧 Advanced",
-                                      font=("Segoe UI", 12, "bold"), padx=15, pady=10)
+        advanced_frame = self._make_section(scrollable_frame, "🔧 Advanced")
         advanced_frame.pack(fill="x", padx=15, pady=10)
         
         self.auto_clear_checkbox = tk.Checkbutton(advanced_frame, text="🧹 Auto-clear log (1000+ entries)",
@@ -1133,8 +1780,7 @@ class DownloadNotifierApp:
         self.details_checkbox.pack(anchor="w", pady=2)
         
         # Application settings
-        app_frame = tk.LabelFrame(scrollable_frame, text="🎨 Application",
-                                 font=("Segoe UI", 12, "bold"), padx=15, pady=10)
+        app_frame = self._make_section(scrollable_frame, "🎨 Application")
         app_frame.pack(fill="x", padx=15, pady=10)
         
         # Theme selection
@@ -1143,7 +1789,9 @@ class DownloadNotifierApp:
         
         tk.Label(theme_selection, text="Theme:", font=("Segoe UI", 10)).pack(side="left")
         
-        self.theme_var = tk.StringVar(value=self.current_theme)
+        # Reuse the header dropdown's variable so both controls stay in sync
+        if not hasattr(self, 'theme_var'):
+            self.theme_var = tk.StringVar(value=self.current_theme)
         for theme in ["light", "dark"]:
             rb = tk.Radiobutton(theme_selection, text=theme.title(), variable=self.theme_var,
                                value=theme, command=self.apply_theme,
@@ -1202,13 +1850,15 @@ class DownloadNotifierApp:
         setattr(self, f"stat_{key}", value_label)
     
     def _center_window(self):
-        """Center the window on screen"""
-        self.master.update_idletasks()
-        width = self.master.winfo_width()
-        height = self.master.winfo_height()
-        x = (self.master.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.master.winfo_screenheight() // 2) - (height // 2)
-        self.master.geometry(f'{width}x{height}+{x}+{y}')
+        """
+        Center the window on screen without forcing a synchronous layout
+        flush: the size is the one __init__ forces via geometry(), not the
+        content's requested size, and only the position is set so children
+        aren't re-laid-out.
+        """
+        x = (self.master.winfo_screenwidth() - WINDOW_WIDTH) // 2
+        y = (self.master.winfo_screenheight() - WINDOW_HEIGHT) // 2
+        self.master.geometry(f'+{x}+{y}')
     
     def toggle_theme(self):
         """Toggle between light and dark themes"""
@@ -1270,56 +1920,92 @@ class DownloadNotifierApp:
         except tk.TclError:
             pass  # Some widgets don't support certain config options
     
+    # Role -> (bg theme key, fixed fg, active-bg theme key); buttons not
+    # in the table get the neutral secondary styling
+    _BUTTON_ROLE_STYLES = {
+        "start": ("accent", "white", "accent_hover"),
+        "stop": ("danger", "white", "danger_hover"),
+    }
+
     def style_button(self, button, theme):
-        """Apply theme-specific styling to buttons"""
-        button_text = button.cget("text")
-        
-        if "Start" in button_text:
-            button.config(bg=theme["accent"], fg="white",
-                         activebackground=theme["accent_hover"])
-        elif "Stop" in button_text:
-            button.config(bg=theme["danger"], fg="white",
-                         activebackground=theme["danger_hover"])
-        elif button == self.theme_button:
-            button.config(bg=theme["secondary_bg"], fg=theme["fg"],
-                         activebackground=theme["hover"])
+        """Apply theme-specific styling to a button via its role tag."""
+        spec = self._BUTTON_ROLE_STYLES.get(getattr(button, "_theme_role", None))
+        if spec:
+            bg_key, fg, hover_key = spec
+            button.config(bg=theme[bg_key], fg=fg,
+                         activebackground=theme[hover_key])
         else:
             button.config(bg=theme["secondary_bg"], fg=theme["fg"],
                          activebackground=theme["hover"])
     
+    _STATUS_COLORS = {
+        "info": "#2196F3",
+        "success": "#4CAF50",
+        "warning": "#ff9800",
+        "error": "#f44336"
+    }
+
     def show_status(self, message, level="info", duration=0):
         """Show status message with optional auto-clear"""
-        colors = {
-            "info": "#2196F3",
-            "success": "#4CAF50", 
-            "warning": "#ff9800",
-            "error": "#f44336"
-        }
-        
-        self.status_label.config(text=message, fg=colors.get(level, "#333333"))
-        
+        # Palette is a class constant and repeated identical messages skip
+        # the config call, so event streams don't churn the label. The
+        # level is part of the check: the same text at a new level still
+        # needs its recolor.
+        if message != self._last_status or level != self._last_status_level:
+            self._last_status = message
+            self._last_status_level = level
+            self.status_label.config(text=message,
+                                     fg=self._STATUS_COLORS.get(level, "#333333"))
+
         if duration > 0:
-            if self.status_timer:
+            if self.status_timer is not None:
                 self.master.after_cancel(self.status_timer)
-            self.status_timer = self.master.after(duration, 
-                lambda: self.status_label.config(text="Ready to monitor downloads...", 
-                                                fg="#333333"))
+            self.status_timer = self.master.after(duration, self._reset_status)
+
+    def _reset_status(self):
+        """Restores the idle status text after a timed message expires."""
+        self.status_timer = None
+        self._last_status = "Ready to monitor downloads..."
+        self._last_status_level = None
+        self.status_label.config(text=self._last_status, fg="#333333")
     
+    def _current_monitor_paths(self):
+        """
+        Returns the canonical monitored-path list, resyncing the mirror
+        first if the entry was hand-edited since the last update.
+        """
+        current = self.monitor_path.get()
+        if current != self._monitor_paths_str:
+            self._monitor_paths = [p.strip() for p in current.split(',') if p.strip()]
+            self._monitor_paths_set = set(self._monitor_paths)
+            self._monitor_paths_str = current
+        return self._monitor_paths
+
+    def _append_monitor_path(self, path):
+        """
+        Appends a directory to the monitored-path entry. Duplicate checks
+        hit the set mirror in O(1), the new value is built with one
+        str.join and one set() call, and a hand-edited entry is detected
+        via the cached joined string and resynced before appending.
+        """
+        self._current_monitor_paths()
+        if path in self._monitor_paths_set:
+            return False
+        self._monitor_paths.append(path)
+        self._monitor_paths_set.add(path)
+        self._monitor_paths_str = ", ".join(self._monitor_paths)
+        self.monitor_path.set(self._monitor_paths_str)
+        return True
+
     def add_quick_path(self, path):
         """Add a quick path to monitoring directories"""
-        current = self.monitor_path.get()
-        if current and current.strip():
-            if path not in current:
-                self.monitor_path.set(f"{current}, {path}")
-        else:
-            self.monitor_path.set(path)
-        
+        self._append_monitor_path(path)
         self.show_status(f"Added: {os.path.basename(path)}", "success", 2000)
     
     def browse_directory(self):
         """Enhanced directory browser"""
         selected_dir = filedialog.askdirectory(
-            initialdir=self.monitor_path.get().split(',')[0].strip() if self.monitor_path.get() else os.path.expanduser("~"),
+            initialdir=self.monitor_path.get().split(',')[0].strip() if self.monitor_path.get() else str(_HOME),
             title="Select Directory to Monitor"
         )
         if selected_dir:
@@ -1327,56 +2013,119 @@ class DownloadNotifierApp:
     
     def test_alarm_sound(self):
         """Test the alarm sound"""
-        if os.path.exists(ALARM_SOUND_FILE):
-            threading.Thread(target=self._play_test_sound, daemon=True).start()
-        else:
-            self.show_status("Alarm sound file not found!", "error", 3000)
+        # _get_alarm_sound generates the file on demand; a missing or
+        # unreadable file surfaces through _play_test_sound's error path
+        self._play_test_sound()
     
     def _play_test_sound(self):
-        """Play test sound in background thread"""
+        """Play the test sound; Sound.play() is non-blocking so no thread is needed"""
         try:
-            pygame.mixer.music.load(ALARM_SOUND_FILE)
-            pygame.mixer.music.play()
+            self._get_alarm_sound().play()
             self.show_status("Playing test sound...", "info", 2000)
         except Exception as e:
             self.show_status(f"Sound test failed: {e}", "error", 3000)
 
+    _LEVEL_ICONS = {
+        "download": "📥 ",
+        "error": "❌ ",
+        "warning": "⚠️ ",
+        "info": "ℹ️ "
+    }
+
     def log_message(self, message, level="info"):
-        """Enhanced logging with filtering and formatting"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
-        
-        # Apply to main log
-        self.status_text.config(state="normal")
-        self.status_text.insert(tk.END, formatted_message, level)
-        self.status_text.see(tk.END)
-        self.status_text.config(state="disabled")
-        
-        # Apply to activity tab log
-        self.log_text.config(state="normal")
-        
-        # Insert timestamp
-        self.log_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-        
-        # Insert message with appropriate tag
-        level_icons = {
-            "download": "📥 ",
-            "error": "❌ ",
-            "warning": "⚠️ ",
-            "info": "ℹ️ "
-        }
-        icon = level_icons.get(level, "")
-        self.log_text.insert(tk.END, f"{icon}{message}\n", level)
-        
-        self.log_text.see(tk.END)
-        self.log_text.config(state="disabled")
-        
-        # Auto-clear if enabled and log is too long
+        """Enhanced logging with filtering and formatting (batched)."""
+        # Raw epoch only; the flush formats one timestamp per second
+        # instead of building a datetime and strftime'ing per message
+        self._rich_log_queue.append((time.time(), level, message))
+        if not self._rich_log_flush_scheduled:
+            self._rich_log_flush_scheduled = True
+            self.master.after(100, self._flush_rich_log)
+
+    def _flush_rich_log(self):
+        """
+        Flushes queued log entries into both Text widgets in one pass. The
+        activity log gets a single insert with tag ranges reapplied from
+        cumulative line offsets, so a burst of N messages costs O(1)
+        inserts instead of 3N Tcl round-trips.
+        """
+        self._rich_log_flush_scheduled = False
+        pending = self._rich_log_queue
+        if not pending:
+            return
+        entries = list(pending)
+        pending.clear()
+
+        # Messages within the same second share one formatted timestamp
+        last_sec = None
+        ts_str = ""
+        stamped = []
+        for ts, level, message in entries:
+            sec = int(ts)
+            if sec != last_sec:
+                ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+                last_sec = sec
+            stamped.append((ts_str, level, message))
+
+        # Main log: runs of consecutive same-level lines share one insert
+        run, run_level = [], None
+        for ts_str, level, message in stamped:
+            if level != run_level and run:
+                self.status_text.insert(tk.END, "".join(run), run_level)
+                run = []
+            run_level = level
+            run.append(f"[{ts_str}] {message}\n")
+        if run:
+            self.status_text.insert(tk.END, "".join(run), run_level)
+
+        # Activity log: one insert, then timestamp/level tags by line range
+        start_line = int(self.log_text.index('end-1c').split('.')[0])
+        parts = []
+        spans = []
+        for offset, (ts_str, level, message) in enumerate(stamped):
+            ts_part = f"[{ts_str}] "
+            parts.append(f"{ts_part}{self._LEVEL_ICONS.get(level, '')}{message}\n")
+            spans.append((start_line + offset, len(ts_part), level))
+        self._log_lines.extend(parts)
+        # Direct Tcl calls: the tag adds run once per line, so skipping
+        # tkinter's wrapper overhead matters most here
+        call, path = self._tk_call, self._log_text_path
+        call(path, "insert", "end", "".join(parts))
+        for line_no, ts_len, level in spans:
+            call(path, "tag", "add", "timestamp",
+                 f"{line_no}.0", f"{line_no}.{ts_len}")
+            call(path, "tag", "add", level,
+                 f"{line_no}.{ts_len}", f"{line_no}.end")
+
+        # Coalesce the scroll: see(END) forces a layout pass, so defer one
+        # to idle time for the whole burst rather than per message
+        if not self._scroll_scheduled:
+            self._scroll_scheduled = True
+            self.master.after_idle(self._scroll_logs_to_end)
+
+        # Ring-buffer trim once per batch: drop the oldest overflow lines
+        # with one delete call per widget instead of wiping the whole log
         if self.auto_clear_log.get():
             line_count = int(self.log_text.index('end-1c').split('.')[0])
             if line_count > 1000:
-                self.clear_log(auto=True)
+                cut = line_count - 1000 + 1
+                self.log_text.delete("1.0", f"{cut}.0")
+
+        # The six-line status strip is a live view, not an archive: keep it
+        # short unconditionally so its line layout never grows into a drag
+        # on every append
+        status_lines = int(self.status_text.index('end-1c').split('.')[0])
+        if status_lines > 200:
+            self.status_text.delete("1.0", f"{status_lines - 200 + 1}.0")
     
+    def _scroll_logs_to_end(self):
+        """Single deferred scroll covering every message logged in a burst."""
+        self._scroll_scheduled = False
+        # Only follow the tail if the user hasn't scrolled up to read
+        # older entries; jumping back down would yank the view from them.
+        for widget in (self.status_text, self.log_text):
+            if widget.yview()[1] >= 0.999:
+                widget.see(tk.END)
+
     def filter_log(self):
         """Filter log display based on selection"""
         filter_value = self.log_filter.get()
@@ -1386,13 +2135,9 @@ class DownloadNotifierApp:
     
     def clear_log(self, auto=False):
         """Clear the activity log"""
-        self.log_text.config(state="normal")
         self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state="disabled")
-        
-        self.status_text.config(state="normal")
         self.status_text.delete(1.0, tk.END)
-        self.status_text.config(state="disabled")
+        self._log_lines.clear()
         
         if not auto:
             self.log_message("Log cleared manually", "info")
@@ -1409,14 +2154,15 @@ class DownloadNotifierApp:
                 initialname=f"download_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
             )
             if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    log_content = self.log_text.get(1.0, tk.END)
-                    f.write(f"Download Notifier Pro v{APP_VERSION} - Activity Log\n")
-                    f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("=" * 50 + "\n\n")
-                    f.write(log_content)
-                
-                self.show_status(f"Log saved: {os.path.basename(filename)}", "success", 3000)
+                header = (f"Download Notifier Pro v{APP_VERSION} - Activity Log\n"
+                          f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                          + "=" * 50 + "\n\n")
+                # Snapshot the mirror deque; reading the Text widget back
+                # would copy the whole log through Tcl
+                self._write_log_file(
+                    filename, (header, *self._log_lines),
+                    lambda: self.show_status(f"Log saved: {os.path.basename(filename)}", "success", 3000),
+                    lambda e: self.show_status(f"Save failed: {e}", "error", 3000))
         except Exception as e:
             self.show_status(f"Save failed: {e}", "error", 3000)
     
@@ -1449,74 +2195,118 @@ class DownloadNotifierApp:
     
     def export_log_json(self, filename):
         """Export log as JSON"""
-        log_data = {
-            "metadata": {
-                "version": APP_VERSION,
-                "exported": datetime.now().isoformat(),
-                "session_start": datetime.fromtimestamp(self.statistics["session_start"]).isoformat()
-            },
-            "statistics": self.statistics,
-            "downloads": self.download_history
+        metadata = {
+            "version": APP_VERSION,
+            "exported": datetime.now().isoformat(),
+            "session_start": self.statistics["session_start_iso"]
         }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False)
-        
-        self.show_status(f"Exported JSON: {os.path.basename(filename)}", "success", 3000)
+        # Snapshot on the Tk thread, then serialize and write off it so
+        # a large export never stalls the event loop
+        self._io_pool.submit(self._write_json_export, filename, metadata,
+                             dict(self.statistics),
+                             list(self.download_history))
+
+    def _write_json_export(self, filename, metadata, statistics, records):
+        try:
+            # Stream the history one record at a time so the export never
+            # holds both the full history and its serialized form in memory
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write('{"metadata": ')
+                f.write(json.dumps(metadata, ensure_ascii=False))
+                f.write(', "statistics": ')
+                f.write(json.dumps(statistics, ensure_ascii=False))
+                f.write(', "downloads": [\n')
+                prefix = ""
+                for record in records:
+                    f.write(prefix)
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    prefix = ",\n"
+                f.write("\n]}\n")
+        except Exception as e:
+            # e is unbound once the except block exits, so capture the
+            # message now rather than inside the deferred lambda
+            msg = f"Export failed: {e}"
+            self._post_to_ui(lambda: self.show_status(msg, "error", 3000))
+        else:
+            self._post_to_ui(lambda: self.show_status(
+                f"Exported JSON: {os.path.basename(filename)}", "success", 3000))
     
     def export_log_csv(self, filename):
         """Export log as CSV"""
+        self._io_pool.submit(self._write_csv_export, filename,
+                             list(self.download_history))
+
+    def _write_csv_export(self, filename, records):
         import csv
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(["Timestamp", "Filename", "Size", "Path", "Status"])
-            
-            for download in self.download_history:
-                writer.writerow([
-                    download.get("timestamp", ""),
-                    download.get("filename", ""),
-                    download.get("size", ""),
-                    download.get("path", ""),
-                    download.get("status", "")
-                ])
-        
-        self.show_status(f"Exported CSV: {os.path.basename(filename)}", "success", 3000)
+        try:
+            with open(filename, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow([name.capitalize() for name in _CSV_FIELDS])
+                
+                # writerows keeps the per-row loop inside the csv module's C
+                # writer, and the compiled itemgetter schema replaces five
+                # dict.get bytecode calls per row
+                writer.writerows(_CSV_ROW(ChainMap(d, _CSV_BLANKS))
+                                 for d in records)
+        except Exception as e:
+            msg = f"Export failed: {e}"
+            self._post_to_ui(lambda: self.show_status(msg, "error", 3000))
+        else:
+            self._post_to_ui(lambda: self.show_status(
+                f"Exported CSV: {os.path.basename(filename)}", "success", 3000))
     
+    def _append_history(self, record):
+        """
+        Appends a download record, spilling the record the bounded deque
+        is about to evict to a JSONL file so long sessions keep a full
+        on-disk trail without unbounded memory.
+        """
+        history = self.download_history
+        if len(history) == history.maxlen:
+            try:
+                if self._history_spill is None:
+                    self._history_spill = open(HISTORY_SPILL_FILE, 'a',
+                                               encoding='utf-8')
+                self._history_spill.write(
+                    json.dumps(history[0], ensure_ascii=False) + "\n")
+            except OSError as e:
+                self._log_message(f"Could not spill history record: {e}", "error")
+        history.append(record)
+        self._history_seq += 1
+
+    def _schedule_stats_refresh(self):
+        """
+        Debounced statistics refresh: a burst of completions yields one
+        display update instead of one per file.
+        """
+        if not self._stats_pending:
+            self._stats_pending = True
+            self.master.after(200, self._run_stats_refresh)
+
+    def _run_stats_refresh(self):
+        self._stats_pending = False
+        self.update_statistics_display()
+
     def update_statistics_display(self):
         """Update the statistics display"""
-        # Calculate session duration
-        duration = time.time() - self.statistics["session_start"]
-        hours, remainder = divmod(duration, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        duration_str = f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
+        # Calculate session duration: one int conversion instead of two
+        # float divmods that each round-trip through float
+        secs = int(time.time() - self.statistics["session_start"])
+        duration_str = f"{secs // 3600:02d}:{secs // 60 % 60:02d}:{secs % 60:02d}"
         
         # Update statistics labels
         self.stat_session_duration.config(text=duration_str)
         self.stat_total_downloads.config(text=str(self.statistics["total_downloads"]))
         
-        # Format total size
-        total_bytes = self.statistics["total_size"]
-        if total_bytes >= 1024**3:
-            size_str = f"{total_bytes / (1024**3):.2f} GB"
-        elif total_bytes >= 1024**2:
-            size_str = f"{total_bytes / (1024**2):.2f} MB"
-        elif total_bytes >= 1024:
-            size_str = f"{total_bytes / 1024:.2f} KB"
-        else:
-            size_str = f"{total_bytes} bytes"
-        
-        self.stat_total_size.config(text=size_str)
+        self.stat_total_size.config(
+            text=_format_size(self.statistics["total_size"]))
         
         # Calculate average size
         if self.statistics["total_downloads"] > 0:
-            avg_bytes = self.statistics["total_size"] / self.statistics["total_downloads"]
-            if avg_bytes >= 1024**2:
-                avg_str = f"{avg_bytes / (1024**2):.2f} MB"
-            elif avg_bytes >= 1024:
-                avg_str = f"{avg_bytes / 1024:.2f} KB"
-            else:
-                avg_str = f"{avg_bytes:.0f} bytes"
+            avg_bytes = self.statistics["total_size"] // self.statistics["total_downloads"]
+            avg_str = _format_size(avg_bytes)
         else:
             avg_str = "N/A"
         
@@ -1527,20 +2317,29 @@ class DownloadNotifierApp:
     
     def update_recent_downloads(self):
         """Update the recent downloads tree view"""
-        # Clear existing items
-        for item in self.recent_tree.get_children():
-            self.recent_tree.delete(item)
-        
-        # Add recent downloads (last 50)
-        recent_downloads = self.download_history[-50:] if len(self.download_history) > 50 else self.download_history
-        
-        for download in reversed(recent_downloads):  # Most recent first
-            self.recent_tree.insert("", "end", values=(
+        history = self.download_history
+        if self._history_seq < self._last_history_seq:
+            # History was cleared; start the view over
+            self.recent_tree.delete(*self.recent_tree.get_children())
+            self._recent_ids.clear()
+            self._last_history_seq = 0
+        
+        # History is append-only, so only the entries added since the last
+        # refresh need inserting (newest on top); the clear-and-reinsert
+        # this replaces redrew all 50 rows on every statistics tick. New
+        # arrivals are the deque's tail, counted by the monotonic sequence.
+        new_count = min(self._history_seq - self._last_history_seq, len(history))
+        for download in itertools.islice(history, len(history) - new_count, None):
+            if len(self._recent_ids) == self._recent_ids.maxlen:
+                self.recent_tree.delete(self._recent_ids.pop())
+            iid = self.recent_tree.insert("", 0, values=(
                 download.get("timestamp", ""),
                 download.get("filename", ""),
                 download.get("size_formatted", ""),
                 download.get("directory", "")
             ))
+            self._recent_ids.appendleft(iid)
+        self._last_history_seq = self._history_seq
     
     def export_statistics(self):
         """Export statistics to file"""
@@ -1555,32 +2354,48 @@ class DownloadNotifierApp:
             if filename:
                 stats_data = {
                     "export_time": datetime.now().isoformat(),
-                    "session_statistics": self.statistics,
-                    "download_history": self.download_history,
+                    "session_statistics": dict(self.statistics),
+                    "download_history": list(self.download_history),
                     "settings": {
                         "min_file_size": self.min_file_size.get(),
-                        "monitored_paths": self.monitor_path.get().split(',')
+                        "monitored_paths": list(self._current_monitor_paths())
                     }
                 }
                 
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(stats_data, f, indent=2, ensure_ascii=False)
-                
-                self.show_status(f"Statistics exported: {os.path.basename(filename)}", "success", 3000)
+                # stats_data holds snapshots, so serialization and the
+                # write can both leave the Tk thread
+                self._io_pool.submit(self._write_stats_export, filename,
+                                     stats_data)
                 
         except Exception as e:
             self.show_status(f"Export failed: {e}", "error", 3000)
+
+    def _write_stats_export(self, filename, stats_data):
+        try:
+            payload = json.dumps(stats_data, indent=2, ensure_ascii=False)
+            with open(filename, 'w', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                f.write(payload)
+        except Exception as e:
+            msg = f"Export failed: {e}"
+            self._post_to_ui(lambda: self.show_status(msg, "error", 3000))
+        else:
+            self._post_to_ui(lambda: self.show_status(
+                f"Statistics exported: {os.path.basename(filename)}", "success", 3000))
     
     def clear_statistics(self):
         """Clear statistics and download history"""
         if messagebox.askyesno("Clear Statistics", 
                               "Are you sure you want to clear all statistics and download history?"):
+            session_start = time.time()
             self.statistics = {
                 "total_downloads": 0,
                 "total_size": 0,
-                "session_start": time.time()
+                "session_start": session_start,
+                "session_start_iso": datetime.fromtimestamp(session_start).isoformat()
             }
             self.download_history.clear()
+            self._history_seq = 0
             self.update_statistics_display()
             self.show_status("Statistics cleared", "info", 2000)
     
@@ -1624,7 +2439,7 @@ class DownloadNotifierApp:
                 continue
                 
             try:
-                observer = Observer()
+                observer = _make_observer(path_to_monitor)
                 observer.schedule(self.event_handler, path_to_monitor, recursive=True)
                 observer.start()
                 self.observers.append(observer)
@@ -1688,23 +2503,15 @@ class DownloadNotifierApp:
         level_map = {"download": "download", "error": "error", "info": "info"}
         self.log_message(message, level_map.get(tag, "info"))
 
-    def notify_download_complete(self, file_path):
+    def notify_download_complete(self, file_path, final_size_bytes=None):
         """Enhanced download completion notification"""
         download_name = os.path.basename(file_path)
         
         try:
-            file_size = os.path.getsize(file_path)
+            file_size = final_size_bytes if final_size_bytes is not None else os.path.getsize(file_path)
+            
+            size_str = _format_size(file_size)
             
-            # Format size
-            if file_size >= 1024**3:
-                size_str = f"{file_size / (1024**3):.2f} GB"
-            elif file_size >= 1024**2:
-                size_str = f"{file_size / (1024**2):.2f} MB"
-            elif file_size >= 1024:
-                size_str = f"{file_size / 1024:.2f} KB"
-            else:
-                size_str = f"{file_size:,} bytes"
-                
             # Update statistics
             self.statistics["total_downloads"] += 1
             self.statistics["total_size"] += file_size
@@ -1719,7 +2526,12 @@ class DownloadNotifierApp:
                 "directory": os.path.dirname(file_path),
                 "status": "completed"
             }
-            self.download_history.append(download_record)
+            if self.show_file_details.get():
+                try:
+                    download_record["sha256"] = _sha256_file(file_path)
+                except OSError as e:
+                    self.log_message(f"Could not hash {download_name}: {e}", "info")
+            self._append_history(download_record)
             
             # Create notification message
             if self.show_file_details.get():
@@ -1731,15 +2543,15 @@ class DownloadNotifierApp:
             self.log_message(f"Download completed: {download_name} ({size_str})", "download")
             
             # Show notifications
-            self.master.after(0, lambda: self._show_notification_and_play_sound(download_name, notification_msg))
+            self._post_to_ui(lambda: self._show_notification_and_play_sound(download_name, notification_msg))
             
             # Update statistics display if on statistics tab
-            self.master.after(100, self.update_statistics_display)
+            self._schedule_stats_refresh()
             
         except Exception as e:
             self.log_message(f"Error processing completed download {download_name}: {e}", "error")
             # Fallback notification
-            self.master.after(0, lambda: self._show_notification_and_play_sound(download_name))
+            self._post_to_ui(lambda: self._show_notification_and_play_sound(download_name))
 
     def _show_notification_and_play_sound(self, download_name, notification_msg=None):
         """Enhanced notification display"""
@@ -1748,10 +2560,10 @@ class DownloadNotifierApp:
             
         self.show_status(f"✅ Download Complete: {download_name}", "success", 5000)
 
-        # Play sound if enabled
+        # Play sound if enabled; play() is non-blocking and _play_alarm_sound
+        # touches widgets, so it must stay on the Tk thread
         if self.notification_sound_enabled.get():
-            sound_thread = threading.Thread(target=self._play_alarm_sound, daemon=True)
-            sound_thread.start()
+            self._play_alarm_sound()
 
         # Show popup if enabled
         if self.notification_popup_enabled.get():
@@ -1911,14 +2723,12 @@ This software is open source and free to use.
                 pygame.mixer.music.play()
                 
                 # Enable stop button
-                self.master.after(0, lambda: self.stop_alarm_button.config(state="normal"))
+                self._post_to_ui(lambda: self.stop_alarm_button.config(state="normal"))
                 
-                # Wait for sound to finish
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                    
-                # Disable stop button
-                self.master.after(0, lambda: self.stop_alarm_button.config(state="disabled"))
+                # Watch for completion from the Tk loop instead of parking
+                # this thread in a sleep(0.1) loop for the whole sound
+                self._post_to_ui(
+                    lambda: self.master.after(100, self._poll_alarm_end))
             else:
                 self.log_message(f"Alarm sound file not found: {ALARM_SOUND_FILE}", "error")
                 
@@ -1927,6 +2737,13 @@ This software is open source and free to use.
         except Exception as e:
             self.log_message(f"Unexpected sound error: {e}", "error")
 
+    def _poll_alarm_end(self):
+        """Re-disables the stop button once music playback finishes."""
+        if pygame.mixer.music.get_busy():
+            self.master.after(100, self._poll_alarm_end)
+        else:
+            self.stop_alarm_button.config(state="disabled")
+
     def on_closing(self):
         """Enhanced graceful shutdown"""
         if self.is_monitoring:
@@ -1965,17 +2782,13 @@ This software is open source and free to use.
             elif isinstance(widget, tk.Entry):
                 widget.config(bg=theme_colors["entry_bg"], fg=theme_colors["entry_fg"], insertbackground=theme_colors["fg"])
             elif isinstance(widget, tk.Button):
-                # Specific button colors from theme
-                if widget == self.start_button:
-                    widget.config(bg=theme_colors["button_bg"], fg=theme_colors["button_fg"])
-                elif widget == self.stop_button:
-                    widget.config(bg=theme_colors["stop_button_bg"], fg=theme_colors["stop_button_fg"])
-                elif widget == self.browse_button:
-                    widget.config(bg=theme_colors["browse_button_bg"], fg=theme_colors["browse_button_fg"])
-                elif widget == self.stop_alarm_button:
-                    widget.config(bg=theme_colors["stop_alarm_button_bg"], fg=theme_colors["stop_alarm_button_fg"])
-                elif widget in [self.clear_log_button, self.save_log_button]:
-                    widget.config(bg=theme_colors["browse_button_bg"], fg=theme_colors["browse_button_fg"])
+                # Buttons carry a role tag set at creation; one lookup in
+                # _ROLE_COLORS replaces the old per-button identity chain
+                role = getattr(widget, "_theme_role", None)
+                keys = _ROLE_COLORS.get(role)
+                if keys:
+                    bg_key, fg_key = keys
+                    widget.config(bg=theme_colors[bg_key], fg=theme_colors[fg_key])
             elif isinstance(widget, tk.Label):
                 # Apply foreground based on label type
                 if widget == self.about_link_label:
@@ -1992,43 +2805,58 @@ This software is open source and free to use.
         """Opens a directory selection dialog."""
         selected_dir = filedialog.askdirectory(initialdir=self.monitor_path.get())
         if selected_dir:
-            # If there are already paths, add the new one with comma separation
-            current_paths = self.monitor_path.get()
-            if current_paths and current_paths.strip():
-                self.monitor_path.set(f"{current_paths}, {selected_dir}")
-            else:
-                self.monitor_path.set(selected_dir)
+            self._append_monitor_path(selected_dir)
 
     def _clear_log(self):
         """Clears the activity log."""
-        self.log_text.config(state="normal")
         self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state="disabled")
+        self._log_lines.clear()
         self._log_message("Log cleared", "info")
 
+    def _write_log_file(self, filename, lines, on_done, on_error):
+        """
+        Writes log lines on a background thread so a multi-megabyte log
+        never freezes the UI; the outcome callback is posted back to the
+        Tk thread. lines must be a snapshot the Tk thread won't mutate.
+        """
+        def _do_save():
+            try:
+                with open(filename, 'w', encoding='utf-8',
+                          buffering=1 << 20) as f:
+                    f.writelines(lines)
+                self._post_to_ui(on_done)
+            except Exception as e:
+                err = e # e unbinds when the except block exits
+                self._post_to_ui(lambda: on_error(err))
+        threading.Thread(target=_do_save, daemon=True).start()
+
     def _save_log(self):
         """Saves the activity log to a file."""
-        try:
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".txt",
-                filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-                title="Save Activity Log"
-            )
-            if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    log_content = self.log_text.get(1.0, tk.END)
-                    f.write(log_content)
-                self._log_message(f"Log saved to: {filename}", "info")
-                messagebox.showinfo("Success", f"Log saved successfully to:\n{filename}")
-        except Exception as e:
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            title="Save Activity Log"
+        )
+        if not filename:
+            return
+        # Snapshot on the Tk thread so the writer never races appends;
+        # the mirror deque spares copying the Text widget through Tcl
+        log_lines = tuple(self._log_lines)
+
+        def _on_done():
+            self._log_message(f"Log saved to: {filename}", "info")
+            messagebox.showinfo("Success", f"Log saved successfully to:\n{filename}")
+
+        def _on_error(e):
             self._log_message(f"Error saving log: {e}", "error")
             messagebox.showerror("Error", f"Failed to save log:\n{e}")
 
+        self._write_log_file(filename, log_lines, _on_done, _on_error)
+
     def start_monitoring(self):
         """Starts monitoring the selected directory using SizeAwareDownloadHandler."""
-        paths_to_monitor_str = self.monitor_path.get()
-        # Split by comma and clean up whitespace, filter out empty strings
-        paths = [p.strip() for p in paths_to_monitor_str.split(',') if p.strip()]
+        # The mirror list is already parsed; no per-start split/strip pass
+        paths = list(self._current_monitor_paths())
 
         if not paths:
             messagebox.showerror("Error", "No directories specified for monitoring.")
@@ -2047,20 +2875,40 @@ This software is open source and free to use.
         self.observers = [] # Reset list of observers
         monitoring_successful_paths = []
 
-        for path_to_monitor in paths:
-            if not os.path.isdir(path_to_monitor):
+        # Validate all paths concurrently: each isdir is a blocking stat()
+        # that can take seconds on an unreachable network drive, so the
+        # checks run in parallel instead of serializing one drive at a time.
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            validated = list(zip(paths, ex.map(os.path.isdir, paths)))
+
+        # One Observer can schedule any number of paths, so all local
+        # directories share a single watcher thread (and, where native
+        # events don't work, all network mounts share one PollingObserver)
+        # instead of spinning up a thread and inotify descriptor per path.
+        shared_observers = {}
+        for path_to_monitor, is_valid in validated:
+            if not is_valid:
                 self._log_message(f"Warning: Invalid directory path skipped: {path_to_monitor}", "error")
                 continue
             try:
+                kind = "polling" if _is_network_path(path_to_monitor) else "native"
+                observer = shared_observers.get(kind)
+                if observer is None:
+                    observer = _make_observer(path_to_monitor)
+                    shared_observers[kind] = observer
                 # Changed recursive to True to monitor subdirectories
-                observer = Observer()
                 observer.schedule(self.event_handler, path_to_monitor, recursive=True)
-                observer.start()
-                self.observers.append(observer)
                 monitoring_successful_paths.append(path_to_monitor)
             except Exception as e:
                 self._log_message(f"Failed to start monitoring for {path_to_monitor}: {e}", "error")
 
+        for observer in shared_observers.values():
+            try:
+                observer.start()
+                self.observers.append(observer)
+            except Exception as e:
+                self._log_message(f"Failed to start observer: {e}", "error")
+
         if monitoring_successful_paths:
             self.is_monitoring = True
             self.start_button.config(state="disabled")
@@ -2093,49 +2941,149 @@ This software is open source and free to use.
         self.update_status("Monitoring stopped.")
         self._log_message("Monitoring stopped.", "info")
 
+    def _on_alarm_finished(self):
+        """Timer callback at the end of playback: clears the cached flag."""
+        self._alarm_timer = None
+        self._alarm_playing = False
+        self.stop_alarm_button.config(state="disabled")
+
     def stop_alarm(self):
         """Stops the currently playing alarm sound."""
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.stop()
+        if self._alarm_playing:
+            if self._alarm_channel is not None:
+                self._alarm_channel.stop()
+            # Cancel the length-based timer too, or it would fire during
+            # the next alarm and clear that playback's state mid-sound
+            if self._alarm_timer is not None:
+                self.master.after_cancel(self._alarm_timer)
+                self._alarm_timer = None
+            self._alarm_playing = False
             self.stop_alarm_button.config(state="disabled")
             self.update_status("Alarm stopped.")
             self._log_message("Alarm manually stopped.", "info")
         else:
             self.update_status("No alarm is currently playing.")
 
-    def update_status(self, message):
-        """Updates the status label in the GUI."""
-        self.master.after(0, lambda: self.status_label.config(text=message))
+    def _post_to_ui(self, fn):
+        """
+        Runs fn on the Tk thread via the <<UIWork>> virtual event. Unlike
+        after(0, ...) this avoids a fresh entry in Tcl's time-ordered timer
+        heap per call and keeps FIFO ordering with the status updates that
+        share the queue.
+        """
+        self._ui_queue.put(("call", fn))
+        try:
+            self.master.event_generate("<<UIWork>>", when="tail")
+        except tk.TclError:
+            pass # Window is being torn down
 
-    def _log_message(self, message, tag=None):
-        """Adds a message to the log text area."""
-        self.master.after(0, lambda: self._insert_log_message(message, tag))
+    def update_status(self, message):
+        """Updates the status label in the GUI (thread-safe via virtual event)."""
+        self._ui_queue.put(("status", message))
+        try:
+            self.master.event_generate("<<UIWork>>", when="tail")
+        except tk.TclError:
+            pass # Window is being torn down
 
-    def _insert_log_message(self, message, tag):
-        self.log_text.config(state="normal")
-        self.log_text.insert(tk.END, f"{time.strftime('%H:%M:%S')} - {message}\n", tag)
-        self.log_text.see(tk.END) # Scroll to the end
-        self.log_text.config(state="disabled")
+    def _drain_ui_queue(self, event=None):
+        """
+        Runs queued UI work on the Tk thread. Posted callables run in FIFO
+        order; for status updates only the newest message matters, so a
+        burst collapses to one config call.
+        """
+        status = None
+        while True:
+            try:
+                kind, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "status":
+                status = payload
+            else:
+                payload()
+        if status is not None:
+            # Debounce: 20 statuses flashing within the window produce one
+            # label config and one redraw, imperceptibly later
+            self._pending_status = status
+            if not self._status_flush_scheduled:
+                self._status_flush_scheduled = True
+                self.master.after(30, self._flush_status)
+
+    def _flush_status(self):
+        """Applies the newest pending status message to the label."""
+        self._status_flush_scheduled = False
+        message = self._pending_status
+        self._pending_status = None
+        if message is not None:
+            # Keep the dedupe state honest: show_status must not skip its
+            # next update just because the label once held the same text
+            self._last_status = message
+            self._last_status_level = None
+            self.status_label.config(text=message)
 
-    def notify_download_complete(self, file_path):
+    def _log_message(self, message, tag=None):
+        """Adds a message to the log text area (batched via the log queue)."""
+        # Raw epoch only; strftime (a localtime call per message) is done
+        # once per distinct second when the batch is flushed
+        self._log_queue.append((time.time(), message, tag))
+        # Disk persistence goes through the queue listener, never this thread
+        if self._log_listener:
+            self._file_log.log(logging.ERROR if tag == "error" else logging.INFO, message)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.master.after(50, self._flush_log)
+
+    def _flush_log(self):
+        """
+        Drains pending log lines into the Text widget in one batch. Runs of
+        consecutive lines with the same tag are joined and inserted together,
+        so a burst costs one widget-state cycle and one insert per tag run
+        instead of one per message.
+        """
+        self._log_flush_scheduled = False
+        pending = self._log_queue
+        if not pending:
+            return
+        run = []
+        run_tag = None
+        last_sec = None
+        ts_str = ""
+        while pending:
+            ts, message, tag = pending.popleft()
+            # Messages queued within the same second share one formatted
+            # timestamp instead of paying for strftime per line
+            sec = int(ts)
+            if sec != last_sec:
+                ts_str = time.strftime('%H:%M:%S', time.localtime(sec))
+                last_sec = sec
+            if tag != run_tag and run:
+                self.log_text.insert(tk.END, "".join(run), run_tag or ())
+                run = []
+            run_tag = tag
+            line = f"{ts_str} - {message}\n"
+            self._log_lines.append(line)
+            run.append(line)
+        if run:
+            self.log_text.insert(tk.END, "".join(run), run_tag or ())
+        # Scroll once per batch, and only when the user is already at the
+        # bottom — a reader scrolled up shouldn't be yanked back down
+        if self.log_text.yview()[1] >= 0.999:
+            self.log_text.see(tk.END)
+
+    def notify_download_complete(self, file_path, final_size_bytes=None):
         """
         Triggers the notification (sound and GUI update) when a download is complete.
         This method is called from the DownloadHandler thread, so it uses master.after()
         to safely update the GUI. Includes file size in notification.
+
+        final_size_bytes carries the size the handler already stat'd during
+        its completion check, so no extra getsize syscall is needed here.
         """
         download_name = os.path.basename(file_path)
         try:
-            file_size = os.path.getsize(file_path)
-            size_mb = file_size / (1024 * 1024)
+            file_size = final_size_bytes if final_size_bytes is not None else os.path.getsize(file_path)
+            size_str = _format_size(file_size)
             
-            if size_mb >= 1: # Use MB for files 1MB or larger
-                size_str = f"{size_mb:.2f} MB"
-            elif file_size >= 1024: # Use KB for files 1KB or larger
-                size_kb = file_size / 1024
-                size_str = f"{size_kb:.2f} KB"
-            else: # Use bytes for smaller files
-                size_str = f"{file_size:,} bytes"
-                
             status_msg = f"Download Complete: {download_name} ({size_str})"
             notification_msg = f"File '{download_name}' has finished downloading!\n\nSize: {size_str}"
             
@@ -2143,30 +3091,79 @@ This software is open source and free to use.
             status_msg = f"Download Complete: {download_name}"
             notification_msg = f"File '{download_name}' has finished downloading! (Size unknown)"
             self._log_message(f"Could not get file size for notification: {e}", "error")
-            
-        self.master.after(0, lambda: self._show_notification_and_play_sound(download_name, notification_msg))
+
+        # Queue for the Tk thread; completions within the drain window are
+        # coalesced so a burst raises one alarm instead of one per file.
+        self._notify_queue.put((download_name, notification_msg))
         self._log_message(status_msg, "download")
+        if not self._notify_scheduled:
+            self._notify_scheduled = True
+            self.master.after(100, self._drain_notifications)
+
+    def _drain_notifications(self):
+        """
+        Renders all pending completion notifications in one pass. A single
+        completion keeps the detailed per-file message; several are folded
+        into one aggregate notification with one sound and one popup.
+        """
+        self._notify_scheduled = False
+        items = []
+        while True:
+            try:
+                items.append(self._notify_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not items:
+            return
+        if len(items) == 1:
+            download_name, notification_msg = items[0]
+            self._show_notification_and_play_sound(download_name, notification_msg)
+        else:
+            names = "\n".join(name for name, _msg in items)
+            combined = f"{len(items)} downloads have finished:\n\n{names}"
+            self._show_notification_and_play_sound(f"{len(items)} downloads", combined)
+
+    def _get_alarm_sound(self):
+        """
+        Returns the alarm as a pygame Sound, decoded from disk only on the
+        first call and reused for every subsequent alarm.
+        """
+        if self._alarm_sound is None:
+            _ensure_alarm_file()
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            self._alarm_sound = pygame.mixer.Sound(ALARM_SOUND_FILE)
+        return self._alarm_sound
 
     def _play_alarm_sound(self):
-        """Plays the alarm sound using pygame.mixer.music."""
+        """
+        Plays the preloaded alarm sound. play() itself is non-blocking, so
+        this runs on the Tk thread; the stop button is re-disabled by a
+        timer sized from the sound's length instead of a thread polling
+        get_busy() every 100ms.
+        """
         if not self.notification_sound_enabled.get():
             return
-            
+
         try:
-            if not pygame.mixer.get_init():
-                pygame.mixer.init() # Ensure mixer is initialized in this thread if it wasn't already
-
-            pygame.mixer.music.load(ALARM_SOUND_FILE)
-            pygame.mixer.music.play()
-            self.master.after(0, lambda: self.stop_alarm_button.config(state="normal")) # Enable stop button
-            # Wait for sound to finish, then disable stop button
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-            self.master.after(0, lambda: self.stop_alarm_button.config(state="disabled")) # Disable stop button
+            # Audio can't usefully overlap: if the alarm is still sounding
+            # from a previous completion, don't stack another play on top
+            if self._alarm_playing:
+                return
+            sound = self._get_alarm_sound()
+            # A stale timer from an earlier play would end this playback's
+            # bookkeeping early; there is at most one alarm, so one timer
+            if self._alarm_timer is not None:
+                self.master.after_cancel(self._alarm_timer)
+            self._alarm_channel = sound.play()
+            self._alarm_playing = True
+            self.stop_alarm_button.config(state="normal") # Enable stop button
+            self._alarm_timer = self.master.after(
+                int(sound.get_length() * 1000) + 50, self._on_alarm_finished)
         except pygame.error as e:
-            self._log_message(f"Error playing sound with Pygame in thread: {e}. Check if '{ALARM_SOUND_FILE}' exists and is a valid audio file.", "error")
+            self._log_message(f"Error playing sound with Pygame: {e}. Check if '{ALARM_SOUND_FILE}' exists and is a valid audio file.", "error")
         except Exception as e:
-            self._log_message(f"An unexpected error occurred in sound thread: {e}", "error")
+            self._log_message(f"An unexpected error occurred playing sound: {e}", "error")
 
     def _show_notification_and_play_sound(self, download_name, notification_msg=None):
         """Helper to show notification and play sound on the main thread."""
@@ -2175,15 +3172,33 @@ This software is open source and free to use.
             
         self.update_status(f"Download Complete: {download_name}!")
 
-        # Start a new thread to play the alarm sound
+        # play() is non-blocking, so no dedicated sound thread is needed
         if self.notification_sound_enabled.get():
-            sound_thread = threading.Thread(target=self._play_alarm_sound)
-            sound_thread.daemon = True # Allow thread to exit with main app
-            sound_thread.start()
+            self._play_alarm_sound()
 
-        # Show the message box on the main thread (this will block until dismissed)
+        # A toast instead of messagebox.showinfo: the message box spins a
+        # nested event loop, so an undismissed popup would stall every
+        # later completion behind it
         if self.notification_popup_enabled.get():
-            messagebox.showinfo("Download Complete", notification_msg)
+            self._toast(f"✅ Download Complete\n\n{notification_msg}")
+
+    def _toast(self, message, duration=3000):
+        """Shows a self-dismissing notification window near the app's
+        bottom-right corner without blocking the event loop."""
+        theme = DARK_THEME if self.current_theme == "dark" else LIGHT_THEME
+        top = tk.Toplevel(self.master)
+        top.overrideredirect(True)
+        top.attributes("-topmost", True)
+        tk.Label(top, text=message, justify="left", font=("Segoe UI", 10),
+                 bg=theme["secondary_bg"], fg=theme["fg"],
+                 bd=1, relief="solid", padx=15, pady=10).pack()
+        top.update_idletasks()
+        x = (self.master.winfo_rootx() + self.master.winfo_width()
+             - top.winfo_reqwidth() - 20)
+        y = (self.master.winfo_rooty() + self.master.winfo_height()
+             - top.winfo_reqheight() - 20)
+        top.geometry(f"+{x}+{y}")
+        top.after(duration, top.destroy)
 
     def _show_about(self):
         """Displays an about message box."""
@@ -2215,11 +3230,19 @@ This software is open source and free to use.
         """Handles graceful shutdown when the window is closed."""
         if self.is_monitoring:
             self.stop_monitoring()
-        # Ensure any playing music is stopped before quitting mixer
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.stop()
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+        # Ensure any playing alarm is stopped before quitting mixer; the
+        # cached flag avoids touching SDL's mixer lock during teardown
+        if self._alarm_playing and self._alarm_channel is not None:
+            self._alarm_channel.stop()
         if pygame.mixer.get_init():
             pygame.mixer.quit()
+        if self._history_spill is not None:
+            self._history_spill.close()
+            self._history_spill = None
+        self._io_pool.shutdown(wait=False)
         # If pygame was initialized, it's good practice to quit all modules
         # However, pygame.mixer.quit() is often sufficient for most use cases
         # and pygame.quit() can sometimes cause issues if other modules were
@@ -2246,8 +3269,7 @@ This software is open source and free to use.
         canvas.create_window((0, 0), window=scrollable_dashboard, anchor="nw")
         
         # Real-time monitoring section
-        monitoring_frame = tk.LabelFrame(scrollable_dashboard, text="🔴 Live Monitoring",
-                                       font=("Segoe UI", 12, "bold"), padx=15, pady=10)
+        monitoring_frame = self._make_section(scrollable_dashboard, "🔴 Live Monitoring")
         monitoring_frame.pack(fill="x", padx=15, pady=10)
         
         # Current activity indicator
@@ -2255,8 +3277,7 @@ This software is open source and free to use.
         self.activity_canvas.pack(fill="x", pady=10)
         
         # System performance metrics
-        performance_frame = tk.LabelFrame(scrollable_dashboard, text="⚡ Performance",
-                                        font=("Segoe UI", 12, "bold"), padx=15, pady=10)
+        performance_frame = self._make_section(scrollable_dashboard, "⚡ Performance")
         performance_frame.pack(fill="x", padx=15, pady=10)
         
         metrics_grid = tk.Frame(performance_frame)
@@ -2373,33 +3394,93 @@ This software is open source and free to use.
         if self.enable_gradient.get() and "gradient_start" in theme:
             self.apply_gradient_effects(theme)
 
-    def apply_theme_to_widget(self, widget, theme):
-        """Recursively apply theme to widget and children"""
-        try:
-            widget_class = widget.winfo_class()
-            
-            if widget_class in ['Frame', 'Toplevel']:
-                widget.configure(bg=theme["bg"])
-            elif widget_class == 'Label':
-                widget.configure(bg=theme["bg"], fg=theme["fg"])
-            elif widget_class == 'Button':
-                widget.configure(bg=theme["accent"], fg=theme["bg"],
-                               activebackground=theme["accent_hover"])
-            elif widget_class == 'Entry':
-                widget.configure(bg=theme["entry_bg"], fg=theme["entry_fg"],
-                               insertbackground=theme["fg"])
-            elif widget_class == 'Text':
-                widget.configure(bg=theme["text_bg"], fg=theme["text_fg"],
-                               insertbackground=theme["fg"])
-            elif widget_class == 'Listbox':
-                widget.configure(bg=theme["text_bg"], fg=theme["text_fg"],
-                               selectbackground=theme["accent"])
-        except:
-            pass  # Skip widgets that don't support these options
-        
+    # Widget classes the theme knows how to color; the cache drops
+    # everything else (ttk widgets, scrollbars, ...) at build time
+    _THEMED_CLASSES = frozenset(
+        ('Frame', 'Toplevel', 'Label', 'Button', 'Entry', 'Text', 'Listbox'))
+
+    def _theme_config_map(self, theme):
+        """
+        Builds the per-widget-class config kwargs for a theme once, so the
+        recursive walk does a dict lookup and a single configure(**kwargs)
+        per widget instead of re-deriving colors down an if/elif chain.
+        """
+        return {
+            'Frame': {'bg': theme["bg"]},
+            'Toplevel': {'bg': theme["bg"]},
+            'Label': {'bg': theme["bg"], 'fg': theme["fg"]},
+            'Button': {'bg': theme["accent"], 'fg': theme["bg"],
+                       'activebackground': theme["accent_hover"]},
+            'Entry': {'bg': theme["entry_bg"], 'fg': theme["entry_fg"],
+                      'insertbackground': theme["fg"]},
+            'Text': {'bg': theme["text_bg"], 'fg': theme["text_fg"],
+                     'insertbackground': theme["fg"]},
+            'Listbox': {'bg': theme["text_bg"], 'fg': theme["text_fg"],
+                        'selectbackground': theme["accent"]},
+        }
+
+    def apply_theme_to_widget(self, widget, theme, cfg_map=None):
+        """
+        Apply theme to widget and children. The flattened (widget, class)
+        list is cached after the first walk from the root: winfo_class is
+        a Tcl round-trip per node, so later theme switches iterate the
+        cache flat instead of re-walking and re-classifying the tree.
+        """
+        if cfg_map is None:
+            cfg_map = self._theme_config_map(theme)
+
+        if widget is self.master:
+            if self._themed_widgets is None:
+                # Keep only classes the config map covers: widgets the
+                # theme never touches shouldn't cost a lookup per switch
+                flattened = []
+                stack = [widget]
+                while stack:
+                    w = stack.pop()
+                    klass = w.winfo_class()
+                    if klass in self._THEMED_CLASSES:
+                        flattened.append((w, klass))
+                    stack.extend(w.winfo_children())
+                self._themed_widgets = flattened
+            # Configure in idle-time chunks so a switch over hundreds of
+            # widgets never blocks the event loop for a whole frame. A new
+            # switch simply replaces the in-progress state and restarts.
+            self._theme_apply_state = (self._themed_widgets, cfg_map, 0)
+            self.master.after_idle(self._apply_theme_chunk)
+            return
+
+        cfg = cfg_map.get(widget.winfo_class())
+        if cfg:
+            try:
+                widget.configure(**cfg)
+            except tk.TclError:
+                pass  # Skip widgets that don't support these options
+
         # Apply to children
         for child in widget.winfo_children():
-            self.apply_theme_to_widget(child, theme)
+            self.apply_theme_to_widget(child, theme, cfg_map)
+
+    def _apply_theme_chunk(self, chunk_size=50):
+        """Applies the pending theme to the next slice of cached widgets."""
+        state = self._theme_apply_state
+        if state is None:
+            return
+        widgets, cfg_map, start = state
+        for w, klass in widgets[start:start + chunk_size]:
+            cfg = cfg_map.get(klass)
+            if cfg:
+                try:
+                    w.configure(**cfg)
+                except tk.TclError:
+                    # Widget was destroyed since the cache was built;
+                    # rebuild on the next theme switch
+                    self._themed_widgets = None
+        start += chunk_size
+        if start < len(widgets):
+            self._theme_apply_state = (widgets, cfg_map, start)
+            self.master.after_idle(self._apply_theme_chunk)
+        else:
+            self._theme_apply_state = None
 
     def apply_gradient_effects(self, theme):
         """Apply gradient background effects"""
@@ -2631,47 +3712,14 @@ This software is open source and free to use.
 
 # --- Main Execution ---
 if __name__ == "__main__":
-    # Initialize Pygame mixer
-    try:
-        pygame.init()
-        pygame.mixer.init()
-    except Exception as e:
-        print(f"Could not initialize Pygame mixer: {e}")
-        print("Sound notifications will not be available.")
-
-    # Create alarm sound file if it doesn't exist
-    if not os.path.exists(ALARM_SOUND_FILE):
-        try:
-            # Generate a simple beep sound
-            import wave
-            import struct
-            import math
-            
-            def generate_beep(frequency=800, duration=1.0, sample_rate=44100, amplitude=0.5):
-                frames = int(duration * sample_rate)
-                sound_data = []
-                
-                for i in range(frames):
-                    sample = amplitude * math.sin(2 * math.pi * frequency * i / sample_rate)
-                    sound_data.append(int(sample * 32767))
-                
-                return sound_data
-            
-            beep_data = generate_beep(frequency=800, duration=1.5)
-            
-            with wave.open(ALARM_SOUND_FILE, 'w') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 2 bytes per sample
-                wav_file.setframerate(44100)
-                
-                for sample in beep_data:
-                    wav_file.writeframes(struct.pack('<h', sample))
-            
-            print(f"Generated {ALARM_SOUND_FILE} successfully!")
-            
-        except Exception as e:
-            print(f"Could not create alarm sound file: {e}")
-            print("You may need to provide your own alarm.wav file.")
+    # Pygame's mixer is initialized lazily by the first sound playback
+    # (every play path already guards with pygame.mixer.get_init()), so
+    # startup no longer pays for opening the audio device when the user
+    # may never play a sound.
+
+    # The alarm sound file is generated lazily by _ensure_alarm_file()
+    # the first time a sound actually plays, so launch skips the stat and
+    # possible disk write entirely when sound is never used.
 
     # Create and run the application
     root = tk.Tk()